@@ -0,0 +1,230 @@
+"""
+asyncio HTTP backend for the job board scrapers.
+An AsyncJobScraper reuses a JobScraper's board list and parsing code but
+fetches through one shared, connection-pooled aiohttp client, so a single
+thread can keep hundreds of board requests in flight.
+"""
+import asyncio
+import queue
+import threading
+import time
+from datetime import timedelta
+from typing import List, Dict, Iterator, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from rate_limiter import HostRateLimiter
+from models import Job
+from scrapers import BoardResult, JobScraper, log
+
+
+class AsyncResponse:
+    """Minimal response object handed to JobScraper.parse_board."""
+    
+    def __init__(self, status_code: int, content: bytes, headers: Dict, elapsed: timedelta = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        # Request duration, excluding rate-limiter waits (like requests.Response.elapsed)
+        self.elapsed = elapsed or timedelta(0)
+
+
+class AsyncHTTPClient:
+    """
+    Shared aiohttp session with a bounded connection pool.
+    The session is created lazily inside the event loop that first uses it.
+    """
+    
+    def __init__(self, user_agent: str, max_connections: int = 100,
+                 rate_limiter: HostRateLimiter = None):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async HTTP backend (pip install aiohttp)")
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.session = None
+    
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.user_agent}
+            )
+        return self.session
+    
+    async def fetch(self, url: str, timeout: float = 10, headers: Dict = None) -> AsyncResponse:
+        """GET a URL once the per-host rate limiter allows it."""
+        delay = self.rate_limiter.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        session = self._get_session()
+        started = time.monotonic()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            content = await response.read()
+            elapsed = timedelta(seconds=time.monotonic() - started)
+            return AsyncResponse(response.status, content, response.headers, elapsed)
+    
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+class AsyncJobScraper:
+    """
+    Async counterpart of JobScraper.
+    Board selection and parsing are delegated to a regular JobScraper; only
+    the network I/O runs on the event loop.
+    """
+    
+    def __init__(self, scraper: JobScraper, client: AsyncHTTPClient, max_in_flight: int = 50):
+        self.scraper = scraper
+        self.client = client
+        self.max_in_flight = max(1, max_in_flight)
+    
+    @property
+    def name(self) -> str:
+        return self.scraper.name
+    
+    async def scrape_board(self, board, keywords: List[str], locations: List[str], max_jobs: int,
+                           conditional: bool = True) -> BoardResult:
+        """Fetch and parse a single board (see JobScraper.scrape_board). Never raises."""
+        scraper = self.scraper
+        variant = scraper.cache_variant(keywords, locations, max_jobs)
+        started = time.monotonic()
+        try:
+            url, response = None, None
+            for url in scraper.board_urls(board):
+                headers = scraper.cache_headers(url, variant) if conditional else {}
+                response = await self.client.fetch(url, timeout=scraper.timeout, headers=headers)
+                if response.status_code in (200, 304):
+                    break
+        except Exception as e:
+            scraper.record_health(board, None, time.monotonic() - started)
+            log(f"  {scraper.board_label(board)}: ✗ {scraper.name} scraping error: {str(e) or e.__class__.__name__}")
+            return BoardResult([])
+        
+        scraper.record_health(board, response)
+        try:
+            # Parse (or wait for the parser process) on the loop's thread pool,
+            # so other fetches keep running while this board is parsed
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, scraper.process_response, board, url, response,
+                                              variant, keywords, locations, max_jobs, conditional)
+        except Exception as e:
+            log(f"  {scraper.board_label(board)}: ✗ {scraper.name} scraping error: {str(e) or e.__class__.__name__}")
+            return BoardResult([])
+    
+    async def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Job]:
+        """Scrape every board concurrently, in full; results are merged in board order."""
+        boards = self.scraper.boards_to_check(keywords, locations)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        
+        async def bounded(board):
+            async with semaphore:
+                return await self.scrape_board(board, keywords, locations, max_jobs, conditional=False)
+        
+        results = await asyncio.gather(*(bounded(board) for board in boards))
+        return self.scraper.merge_results(results)
+    
+    async def iter_board_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50):
+        """Async generator yielding each board's result in completion order."""
+        boards = self.scraper.boards_to_check(keywords, locations)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        
+        async def bounded(board):
+            async with semaphore:
+                return await self.scrape_board(board, keywords, locations, max_jobs)
+        
+        seen = set()
+        for next_result in asyncio.as_completed([bounded(board) for board in boards]):
+            result = await next_result
+            board_jobs = self.scraper.drop_seen(result.jobs, seen)
+            if board_jobs or result.commit is not None:
+                yield BoardResult(board_jobs, result.commit)
+
+
+class EventLoopThread:
+    """A background event loop shared by every sync adapter in the process."""
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='async-scrapers', daemon=True)
+        self.thread.start()
+    
+    @classmethod
+    def get(cls) -> 'EventLoopThread':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the shared loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+
+class SyncScraperAdapter:
+    """
+    Exposes an AsyncJobScraper through the blocking scrape_jobs contract, so
+    get_all_scrapers can return it alongside regular scrapers.
+    """
+    
+    def __init__(self, async_scraper: AsyncJobScraper):
+        self.async_scraper = async_scraper
+        self.runner = EventLoopThread.get()
+    
+    @property
+    def name(self) -> str:
+        return self.async_scraper.name
+    
+    def board_keys(self, keywords: List[str], locations: List[str]) -> List[str]:
+        return self.async_scraper.scraper.board_keys(keywords, locations)
+    
+    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Job]:
+        return self.runner.run(self.async_scraper.scrape_jobs(keywords, locations, max_jobs))
+    
+    def iter_board_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> Iterator[BoardResult]:
+        """Blocking iterator over AsyncJobScraper.iter_board_jobs."""
+        batches = queue.Queue()
+        done = object()
+        
+        async def pump():
+            try:
+                async for result in self.async_scraper.iter_board_jobs(keywords, locations, max_jobs):
+                    batches.put(result)
+            finally:
+                batches.put(done)
+        
+        future = asyncio.run_coroutine_threadsafe(pump(), self.runner.loop)
+        finished = False
+        try:
+            while True:
+                result = batches.get()
+                if result is done:
+                    finished = True
+                    break
+                yield result
+        finally:
+            # Cancels the remaining fetches only if the consumer stopped early
+            if not finished:
+                future.cancel()
+        # Re-raises anything pump() failed with
+        future.result()
+    
+    def iter_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> Iterator[Job]:
+        for result in self.iter_board_jobs(keywords, locations, max_jobs):
+            yield from result.jobs
+            if result.commit is not None:
+                result.commit()
+    
+    def close(self):
+        """Close the shared HTTP client (safe to call more than once)."""
+        self.runner.run(self.async_scraper.client.close())
@@ -0,0 +1,102 @@
+"""
+Benchmark the HTML parser backends on synthetic Indeed, LinkedIn and Ashby
+result pages, and check that every backend extracts the same cards.
+
+Usage: python benchmark_parsers.py [cards_per_page] [pages]
+"""
+import sys
+import time
+
+from parsers import BACKENDS, available_backends
+
+
+def indeed_page(count: int) -> bytes:
+    cards = []
+    for i in range(count):
+        cards.append(f"""
+        <div class="cardOutline job_seen_beacon result">
+          <table><tr><td>
+            <h2 class="jobTitle css-1psdjh5"><a href="/rc/clk?jk={i:08x}"><span>Software Engineer Intern {i}</span></a></h2>
+            <span data-testid="company-name">Company {i % 37}</span>
+            <div data-testid="text-location">Remote <b>US</b></div>
+          </td></tr></table>
+          <ul class="snippet"><li>Work on distributed systems</li><li>Summer {2026 + i % 2}</li></ul>
+        </div>""")
+    return f"<html><head><title>Indeed</title></head><body>{''.join(cards)}</body></html>".encode()
+
+
+def linkedin_page(count: int) -> bytes:
+    cards = []
+    for i in range(count):
+        cards.append(f"""
+        <li>
+          <div class="base-card relative base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{i}">
+            <a class="base-card__full-link absolute" href="https://www.linkedin.com/jobs/view/{i}"><span class="sr-only">Data Intern {i}</span></a>
+            <div class="base-search-card__info">
+              <h3 class="base-search-card__title">
+                Data Science Intern {i}
+              </h3>
+              <h4 class="base-search-card__subtitle"><a href="#">Company {i % 23}</a></h4>
+              <div class="base-search-card__metadata"><span class="job-search-card__location">New York, NY</span></div>
+            </div>
+          </div>
+        </li>""")
+    return f"<html><body><ul class=\"jobs-search__results-list\">{''.join(cards)}</ul><ul><li>Footer</li></ul></body></html>".encode()
+
+
+def ashby_page(count: int) -> bytes:
+    cards = []
+    for i in range(count):
+        cards.append(f"""
+        <div class="ashby-job-posting-brief">
+          <a class="_container_JobPosting" href="/company/{i:04d}">
+            <h3 class="ashby-job-posting-brief-Title">Machine Learning Intern {i}</h3>
+            <p><span class="ashby-job-posting-brief-Location">San Francisco</span></p>
+          </a>
+        </div>""")
+    return f"<html><body><div id=\"root\">{''.join(cards)}</div></body></html>".encode()
+
+
+PAGES = {
+    'indeed': (indeed_page, 'indeed_cards'),
+    'linkedin': (linkedin_page, 'linkedin_cards'),
+    'ashby': (ashby_page, 'ashby_cards'),
+}
+
+
+def benchmark(cards_per_page: int = 50, pages: int = 50):
+    # BeautifulSoup is the reference implementation, so it runs first
+    backends = ['bs4'] + [name for name in available_backends() if name != 'bs4']
+    print(f"Backends available: {', '.join(backends)}")
+    print(f"{cards_per_page} cards/page, {pages} pages per board type\n")
+    
+    all_match = True
+    for page_name, (make_page, method) in PAGES.items():
+        content = make_page(cards_per_page)
+        reference = None
+        print(f"{page_name} ({len(content) / 1024:.0f} KB/page)")
+        
+        for backend_name in backends:
+            parse = getattr(BACKENDS[backend_name](), method)
+            cards = parse(content, cards_per_page * 2)
+            
+            start = time.perf_counter()
+            for _ in range(pages):
+                parse(content, cards_per_page * 2)
+            elapsed = time.perf_counter() - start
+            
+            if reference is None:
+                reference = cards
+            match = cards == reference
+            all_match = all_match and match
+            print(f"  {backend_name:<12} {elapsed / pages * 1000:8.2f} ms/page  "
+                  f"{len(cards)} cards  {'✓' if match else '✗ output differs'}")
+        print()
+    
+    return all_match
+
+
+if __name__ == "__main__":
+    cards_per_page = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    sys.exit(0 if benchmark(cards_per_page, pages) else 1)
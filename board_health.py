@@ -0,0 +1,129 @@
+"""
+Per-board health tracking.
+Records the status code and latency of every board fetch and backs off
+exponentially from boards that keep failing (e.g. slugs that do not exist on
+an ATS), so check cycles are spent on boards that return data. Backed-off
+boards are re-probed once their backoff expires.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Weight of the newest sample in the moving average latency
+LATENCY_SMOOTHING = 0.3
+
+
+class BoardHealthTracker:
+    """
+    Thread-safe map of board key -> health entry.
+    Scraper workers call should_check() and record(); the owner loads entries
+    from and saves them to the database (JobDatabase.load_board_health /
+    save_board_health) outside the worker threads.
+    """
+    
+    def __init__(self, entries: List[Dict] = None, backoff_minutes: float = 30,
+                 max_backoff_hours: float = 24, failures_before_backoff: int = 2):
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {entry['board_key']: dict(entry) for entry in entries or []}
+        self.backoff_seconds = backoff_minutes * 60
+        self.max_backoff_seconds = max_backoff_hours * 3600
+        # A single timeout should not quarantine a board
+        self.failures_before_backoff = max(1, failures_before_backoff)
+        self.dirty = set()
+        self.checked = 0
+        self.failed = 0
+        self.skipped = 0
+    
+    def begin_cycle(self):
+        """Reset the per-cycle counters."""
+        with self.lock:
+            self.checked = 0
+            self.failed = 0
+            self.skipped = 0
+    
+    def backoff_delay(self, failures: int) -> float:
+        """Seconds to wait before re-probing a board after `failures` consecutive failures."""
+        if failures < self.failures_before_backoff:
+            return 0.0
+        exponent = failures - self.failures_before_backoff
+        return min(self.backoff_seconds * (2 ** min(exponent, 32)), self.max_backoff_seconds)
+    
+    def is_backed_off(self, key: str, now: float = None) -> bool:
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and (entry['next_check_at'] or 0) > now
+    
+    def should_check(self, key: str, now: float = None) -> bool:
+        """False while the board is backed off (counted as skipped)."""
+        if not self.is_backed_off(key, now):
+            return True
+        with self.lock:
+            self.skipped += 1
+        return False
+    
+    def record(self, key: str, status: Optional[int], latency: Optional[float]):
+        """
+        Record one fetch. `status` is the HTTP status (None if the request itself
+        failed); 200 and 304 count as healthy.
+        """
+        now = time.time()
+        ok = status in (200, 304)
+        latency_ms = latency * 1000 if latency is not None else None
+        
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    'board_key': key,
+                    'last_status': None,
+                    'last_latency_ms': None,
+                    'avg_latency_ms': None,
+                    'consecutive_failures': 0,
+                    'total_checks': 0,
+                    'total_failures': 0,
+                    'last_checked_at': None,
+                    'last_success_at': None,
+                    'next_check_at': None,
+                }
+            
+            entry['last_status'] = status
+            entry['last_latency_ms'] = latency_ms
+            if latency_ms is not None:
+                average = entry['avg_latency_ms']
+                entry['avg_latency_ms'] = latency_ms if average is None else (
+                    average + LATENCY_SMOOTHING * (latency_ms - average)
+                )
+            entry['total_checks'] += 1
+            entry['last_checked_at'] = now
+            
+            if ok:
+                entry['consecutive_failures'] = 0
+                entry['last_success_at'] = now
+                entry['next_check_at'] = None
+            else:
+                entry['consecutive_failures'] += 1
+                entry['total_failures'] += 1
+                delay = self.backoff_delay(entry['consecutive_failures'])
+                entry['next_check_at'] = now + delay if delay else None
+                self.failed += 1
+            
+            self.checked += 1
+            self.dirty.add(key)
+    
+    def pop_dirty(self) -> List[Dict]:
+        """Entries changed since the last call (copies), for saving."""
+        with self.lock:
+            changed = [dict(self.entries[key]) for key in self.dirty]
+            self.dirty.clear()
+        return changed
+    
+    def backed_off(self, now: float = None) -> int:
+        """Number of boards currently waiting out a backoff."""
+        now = time.time() if now is None else now
+        with self.lock:
+            return sum(1 for entry in self.entries.values() if (entry['next_check_at'] or 0) > now)
+    
+    def cycle_stats(self) -> Dict:
+        with self.lock:
+            return {'boards_checked': self.checked, 'boards_failed': self.failed, 'boards_skipped': self.skipped}
@@ -2,6 +2,7 @@
 Comprehensive list of tech companies and their job board platforms.
 Add more companies as you discover them!
 """
+from functools import lru_cache
 
 # Big Tech Companies (mostly use Greenhouse or custom platforms)
 BIG_TECH = [
@@ -119,9 +120,16 @@ SPACE_COMPANIES = [
     'astra', 'firefly', 'varda', 'astranis', 'planet-labs',
 ]
 
+# High-priority companies: new jobs here are emailed right away instead of
+# waiting for the next digest (see EMAIL_CONFIG['digest_window_minutes'])
+PRIORITY_COMPANIES = [
+    'openai', 'anthropic', 'stripe', 'databricks', 'figma', 'ramp',
+    'scale-ai', 'notion', 'anduril', 'spacex', 'jane-street', 'citadel',
+]
 
-def get_all_companies():
-    """Get all unique company names."""
+
+@lru_cache(maxsize=None)
+def _all_companies() -> tuple:
     all_companies = set()
     all_companies.update(BIG_TECH)
     all_companies.update(GREENHOUSE_COMPANIES)
@@ -137,4 +145,9 @@ def get_all_companies():
     all_companies.update(GAMING_COMPANIES)
     all_companies.update(AV_ROBOTICS_COMPANIES)
     all_companies.update(SPACE_COMPANIES)
-    return list(all_companies)
+    return tuple(all_companies)
+
+
+def get_all_companies():
+    """Get all unique company names (computed once)."""
+    return list(_all_companies())
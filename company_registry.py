@@ -0,0 +1,147 @@
+"""
+Company registry: company -> ATS -> board slug.
+Built once from the lists in companies.py (plus an optional JSON/CSV data
+file) and indexed so scrapers can fetch their board lists and display names
+with dictionary lookups.
+"""
+import csv
+import json
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+import companies
+
+# ATS lists in companies.py; the other lists only group company names
+ATS_LISTS = {
+    'greenhouse': 'GREENHOUSE_COMPANIES',
+    'lever': 'LEVER_COMPANIES',
+    'ashby': 'ASHBY_COMPANIES',
+}
+
+
+class CompanyBoard(NamedTuple):
+    company: str       # Normalized company key, e.g. 'scale'
+    ats: str           # 'greenhouse', 'lever' or 'ashby'
+    slug: str          # Board identifier the scraper fetches, e.g. 'scale.com'
+    name: Optional[str] = None  # Display name; derived from the slug if missing
+
+
+def company_key(slug: str) -> str:
+    """Company key for a board slug ('Scale.com' -> 'scale')."""
+    return slug.strip().lower().split('.')[0]
+
+
+class CompanyRegistry:
+    """
+    Deduplicated, indexed company boards.
+    Each company has at most one board per ATS; within companies.py the first
+    entry added wins, so a company can be listed under several names without
+    it being scraped twice. Rows from a data file override companies.py, so
+    they can fix a slug or add a display name.
+    """
+    
+    def __init__(self):
+        self.by_company: Dict[str, Dict[str, CompanyBoard]] = {}
+        # ats -> slug -> board, in insertion order
+        self.by_ats: Dict[str, Dict[str, CompanyBoard]] = {}
+    
+    def add(self, slug: str, ats: str, company: str = None, name: str = None,
+            replace: bool = False) -> bool:
+        """
+        Register a board. If the company already has one on this ATS it is
+        kept (returns False), unless `replace` is set: then the new slug
+        replaces it, keeping its display name if the new entry has none.
+        """
+        slug = slug.strip()
+        ats = ats.strip().lower()
+        company = company_key(company or slug)
+        if not slug or not company:
+            return False
+        
+        boards = self.by_company.setdefault(company, {})
+        existing = boards.get(ats)
+        if existing is not None:
+            if not replace:
+                return False
+            name = name or existing.name
+            if existing.slug != slug:
+                del self.by_ats[ats][existing.slug]
+        
+        board = CompanyBoard(company, ats, slug, name or None)
+        boards[ats] = board
+        self.by_ats.setdefault(ats, {})[slug] = board
+        return True
+    
+    def load_companies_module(self):
+        for ats, list_name in ATS_LISTS.items():
+            for slug in getattr(companies, list_name, []):
+                self.add(slug, ats)
+    
+    def load_file(self, path: str) -> int:
+        """
+        Load boards from a data file; returns the number of boards added or
+        updated. Rows override the company's board on the same ATS.
+        JSON: a list of {"company", "ats", "slug", "name"} objects (only ats and
+        slug are required). CSV: the same fields as a header row.
+        """
+        with open(path, 'r', newline='') as f:
+            if os.path.splitext(path)[1].lower() == '.csv':
+                rows = list(csv.DictReader(f))
+            else:
+                rows = json.load(f)
+        
+        added = 0
+        for row in rows:
+            if not row.get('slug') or not row.get('ats'):
+                continue
+            if self.add(row['slug'], row['ats'], row.get('company'), row.get('name'), replace=True):
+                added += 1
+        return added
+    
+    def boards(self, ats: str) -> List[str]:
+        """Board slugs for one ATS, in registration order."""
+        return list(self.by_ats.get(ats, {}))
+    
+    def board(self, ats: str, slug: str) -> Optional[CompanyBoard]:
+        return self.by_ats.get(ats, {}).get(slug)
+    
+    def company_boards(self, company: str) -> Dict[str, CompanyBoard]:
+        """All boards of a company, keyed by ATS."""
+        return dict(self.by_company.get(company_key(company), {}))
+    
+    def display_name(self, ats: str, slug: str) -> Optional[str]:
+        board = self.board(ats, slug)
+        return board.name if board else None
+    
+    def __contains__(self, company: str) -> bool:
+        return company_key(company) in self.by_company
+    
+    def __len__(self) -> int:
+        return sum(len(boards) for boards in self.by_ats.values())
+    
+    def stats(self) -> Dict[str, int]:
+        return {ats: len(boards) for ats, boards in self.by_ats.items()}
+
+
+_registries: Dict[Optional[str], CompanyRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(data_file: str = None) -> CompanyRegistry:
+    """
+    Shared registry built from companies.py, extended by `data_file` if given.
+    Built once per data file and reused afterwards.
+    """
+    with _registries_lock:
+        registry = _registries.get(data_file)
+        if registry is None:
+            registry = CompanyRegistry()
+            registry.load_companies_module()
+            if data_file:
+                try:
+                    registry.load_file(data_file)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Warning: could not load companies file {data_file}: {str(e)}")
+            _registries[data_file] = registry
+        return registry
@@ -11,7 +11,18 @@ EMAIL_CONFIG = {
     'smtp_port': 587,
     'sender_email': 'YOUR_EMAIL@gmail.com',  # ← CHANGE THIS
     'sender_password': 'YOUR_APP_PASSWORD',   # ← CHANGE THIS (use app-specific password)
-    'recipient_email': 'YOUR_EMAIL@gmail.com',  # ← CHANGE THIS
+    'recipient_email': 'YOUR_EMAIL@gmail.com',  # ← CHANGE THIS (several addresses: separate with commas)
+    'background_delivery': True,  # Send alerts from a background thread over one persistent connection
+    'smtp_timeout': 30,  # Seconds before an SMTP connection attempt or command times out
+    'send_attempts': 5,  # Attempts per alert before giving up
+    'retry_backoff_seconds': 5,  # Wait after the first failed attempt; doubles each retry
+    'smtp_idle_seconds': 60,  # Close the connection after this long without alerts
+    'outbox_batch_size': 100,  # Most jobs per alert
+    'max_email_bytes': 100000,  # Larger alerts are split into several emails (Gmail clips above ~100 KB)
+    'digest_window_minutes': 0,  # Collect new jobs into one digest email at most this often (0 = email every check)
+    'digest_max_jobs': 25,  # ...or as soon as this many jobs are waiting (only with a digest window)
+    # 'priority_companies': ['stripe', 'openai'],  # Emailed right away; defaults to PRIORITY_COMPANIES in companies.py
+    'outbox_max_emails_per_check': 10,  # Most alert emails per check; a larger backlog waits for the next check
 }
 
 # Job Search Criteria - Customize based on your needs
@@ -53,6 +64,16 @@ JOB_SEARCH_CONFIG = {
         'Redmond',
     ],
     'experience_levels': ['Internship', 'Entry Level'],
+    # Several subscribers, each with their own filters (an empty list matches anything).
+    # When set, alerts go to these addresses instead of recipient_email; boards are
+    # filtered by the union of their keywords and locations, and Indeed runs each
+    # subscriber's searches (open keywords/locations fall back to the lists above).
+    # Copied into the database only while it has no subscribers; after that use
+    # `main.py subscribe` / `unsubscribe`.
+    # 'subscriptions': [
+    #     {'email': 'alice@example.com', 'keywords': ['software engineer'], 'locations': ['Remote'], 'companies': []},
+    #     {'email': 'bob@example.com', 'keywords': ['data'], 'locations': [], 'companies': ['stripe', 'ramp']},
+    # ],
 }
 
 # Job Boards to Monitor - Enable/disable as needed
@@ -67,11 +88,34 @@ JOB_BOARDS = {
 # Scraping Configuration
 SCRAPING_CONFIG = {
     'check_interval_minutes': 10,  # How often to check for new jobs
+    'check_overlap': 'skip',       # If a check is still running when the next is due: 'skip' or 'coalesce'
+    'check_deadline_minutes': None,  # Warn when a check runs longer than this (default: the interval)
     'max_jobs_per_check': 50,      # Maximum jobs to fetch per check
+    'fetch_workers': 8,            # Boards fetched in parallel per job board
+    'parse_workers': 0,            # Parser processes for HTML pages (e.g. CPU cores); 0 parses in fetch threads
+    'http_backend': 'sync',        # 'sync' (threads) or 'async' (aiohttp, one event loop)
+    'max_connections': 100,        # Connection pool size / requests in flight for 'async'
+    'http_cache_dir': '.http_cache',  # ETag/Last-Modified cache for board APIs (None to disable)
+    'html_parser': 'auto',         # 'selectolax', 'lxml' or 'bs4'; 'auto' picks the fastest installed
+    'companies_file': None,        # Extra company boards (JSON or CSV: company, ats, slug, name)
+    'board_backoff_minutes': 30,   # First backoff for a board that keeps failing (doubles each failure)
+    'board_backoff_max_hours': 24, # Backed-off boards are re-probed at least this often
+    'max_board_requests_per_check': None,  # Board budget per check; busiest boards first (None = all)
+    'max_board_interval_hours': 24,  # Every board is polled at least this often under a budget
+    'churn_window_days': 30,       # History used to estimate each board's posting rate
+    # Per-host token buckets (requests/second, must be > 0; burst). Overrides rate_limiter.DEFAULT_RATE_LIMITS
+    'rate_limits': {
+        'www.indeed.com': {'rate': 0.5, 'burst': 1},
+    },
     'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
 }
 
 # Database Configuration
 DATABASE_CONFIG = {
     'db_path': 'jobs.db',
+    'journal_mode': 'WAL',      # WAL lets the stats command read while a check is running
+    'synchronous': 'NORMAL',    # NORMAL avoids an fsync per commit but can lose the last commits on power failure (no corruption); FULL is durable
+    'cache_size': -16000,       # Page cache size; negative values are KiB (~16 MB)
+    'seen_index_capacity': 100000,   # Initial Bloom filter size (grows automatically)
+    'seen_index_error_rate': 0.001,  # Target false-positive rate (~1.8 bytes per job)
 }
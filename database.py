@@ -1,153 +1,553 @@
 """
 Database module for storing and retrieving job listings.
 """
+import json
 import sqlite3
-from datetime import datetime
-from typing import List, Dict, Optional
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Union
+
+from models import Job
+from seen_index import SeenJobIndex
+
+
+JOB_COLUMNS = 'job_id, title, company, location, url, description, posted_date, source, created_at'
+
+BOARD_HEALTH_COLUMNS = [
+    'board_key', 'last_status', 'last_latency_ms', 'avg_latency_ms', 'consecutive_failures',
+    'total_checks', 'total_failures', 'last_checked_at', 'last_success_at', 'next_check_at',
+]
+
+# Rows per multi-row INSERT: 9 columns x 100 rows stays below SQLite's
+# historical limit of 999 bound parameters.
+INSERT_CHUNK_SIZE = 100
+
+# job_ids per "IN (...)" list, also kept below the 999 parameter limit
+IN_CHUNK_SIZE = 500
+
+# INSERT ... RETURNING needs SQLite 3.35+
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 class JobDatabase:
-    def __init__(self, db_path: str = 'jobs.db'):
+    """
+    SQLite job store.
+    Holds one long-lived connection (shared across threads behind a lock) in
+    WAL mode. Writes run inside transaction(); wrap several calls in
+    `with db.transaction():` to commit them together.
+    """
+    
+    def __init__(self, db_path: str = 'jobs.db', journal_mode: str = 'WAL',
+                 synchronous: str = 'NORMAL', cache_size: int = -16000,
+                 seen_index_capacity: int = 100000, seen_index_error_rate: float = 0.001):
         self.db_path = db_path
+        self.lock = threading.RLock()
+        self.depth = 0
+        
+        # isolation_level=None: transactions are managed explicitly in transaction()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f'PRAGMA journal_mode = {journal_mode}')
+        self.conn.execute(f'PRAGMA synchronous = {synchronous}')
+        # Negative values are in KiB (-16000 ~= 16 MB page cache)
+        self.conn.execute(f'PRAGMA cache_size = {int(cache_size)}')
+        self.conn.execute('PRAGMA temp_store = MEMORY')
+        
         self.init_database()
+        
+        # Bloom filter of every known job_id; negatives skip the database.
+        # Built from the jobs table on the first add_jobs/job_exists call (see
+        # _seen_index), so opening the database, e.g. for stats, stays cheap
+        self.seen_index_capacity = seen_index_capacity
+        self.seen_index_error_rate = seen_index_error_rate
+        self.seen: Optional[SeenJobIndex] = None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of statements in one transaction and yield a cursor.
+        Nested calls join the outer transaction; only the outermost commits.
+        The write lock is held until the block ends, so keep slow work such
+        as sending email outside of it.
+        """
+        with self.lock:
+            if self.depth == 0:
+                self.conn.execute('BEGIN IMMEDIATE')
+            self.depth += 1
+            cursor = self.conn.cursor()
+            try:
+                yield cursor
+            except BaseException:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.conn.execute('ROLLBACK')
+                raise
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.conn.execute('COMMIT')
+            finally:
+                cursor.close()
+    
+    def query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read-only statement (joins the current transaction, if any)."""
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+    
+    def close(self):
+        """Close the underlying connection."""
+        with self.lock:
+            self.conn.close()
     
     def init_database(self):
         """Initialize the database with required tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.transaction() as cursor:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT UNIQUE NOT NULL,
+                    title TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    location TEXT,
+                    url TEXT NOT NULL,
+                    description TEXT,
+                    posted_date TEXT,
+                    source TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    notified INTEGER DEFAULT 0
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_id ON jobs(job_id)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_notified ON jobs(notified)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_created_at ON jobs(created_at)
+            ''')
+            
+            self._init_source_stats(cursor)
+            
+            # Fetch outcome per board (see board_health.py); times are Unix timestamps
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS board_health (
+                    board_key TEXT PRIMARY KEY,
+                    last_status INTEGER,
+                    last_latency_ms REAL,
+                    avg_latency_ms REAL,
+                    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                    total_checks INTEGER NOT NULL DEFAULT 0,
+                    total_failures INTEGER NOT NULL DEFAULT 0,
+                    last_checked_at REAL,
+                    last_success_at REAL,
+                    next_check_at REAL
+                )
+            ''')
+            
+            # Alert subscribers (see subscriptions.py); filter lists are JSON arrays
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    email TEXT PRIMARY KEY COLLATE NOCASE,
+                    keywords TEXT NOT NULL DEFAULT '[]',
+                    locations TEXT NOT NULL DEFAULT '[]',
+                    companies TEXT NOT NULL DEFAULT '[]',
+                    created_at TEXT NOT NULL
+                )
+            ''')
+            
+            # Recipients a pending job has already reached (or been refused by for
+            # good), so a partly failed alert is retried only for the others;
+            # cleared when the job is marked as notified
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS deliveries (
+                    job_row_id INTEGER NOT NULL,
+                    email TEXT NOT NULL COLLATE NOCASE,
+                    PRIMARY KEY (job_row_id, email)
+                ) WITHOUT ROWID
+            ''')
+    
+    def _init_source_stats(self, cursor):
+        """
+        Per-source counters kept up to date by triggers, so get_stats never
+        has to scan the jobs table.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'source_stats'")
+        exists = cursor.fetchone() is not None
         
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id TEXT UNIQUE NOT NULL,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                location TEXT,
-                url TEXT NOT NULL,
-                description TEXT,
-                posted_date TEXT,
-                source TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                notified INTEGER DEFAULT 0
+            CREATE TABLE IF NOT EXISTS source_stats (
+                source TEXT PRIMARY KEY,
+                total_jobs INTEGER NOT NULL DEFAULT 0,
+                notified_jobs INTEGER NOT NULL DEFAULT 0
             )
         ''')
         
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_job_id ON jobs(job_id)
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_insert_stats AFTER INSERT ON jobs
+            BEGIN
+                INSERT INTO source_stats (source, total_jobs, notified_jobs)
+                VALUES (NEW.source, 1, NEW.notified = 1)
+                ON CONFLICT(source) DO UPDATE SET
+                    total_jobs = total_jobs + 1,
+                    notified_jobs = notified_jobs + excluded.notified_jobs;
+            END
         ''')
         
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_notified ON jobs(notified)
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_update_stats AFTER UPDATE OF source, notified ON jobs
+            WHEN OLD.source IS NOT NEW.source OR (OLD.notified = 1) IS NOT (NEW.notified = 1)
+            BEGIN
+                UPDATE source_stats SET
+                    total_jobs = total_jobs - 1,
+                    notified_jobs = notified_jobs - (OLD.notified = 1)
+                WHERE source = OLD.source;
+                INSERT INTO source_stats (source, total_jobs, notified_jobs)
+                VALUES (NEW.source, 1, NEW.notified = 1)
+                ON CONFLICT(source) DO UPDATE SET
+                    total_jobs = total_jobs + 1,
+                    notified_jobs = notified_jobs + excluded.notified_jobs;
+            END
         ''')
         
-        conn.commit()
-        conn.close()
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_delete_stats AFTER DELETE ON jobs
+            BEGIN
+                UPDATE source_stats SET
+                    total_jobs = total_jobs - 1,
+                    notified_jobs = notified_jobs - (OLD.notified = 1)
+                WHERE source = OLD.source;
+            END
+        ''')
+        
+        if not exists:
+            # One-time backfill for databases created before the counters existed
+            cursor.execute('''
+                INSERT INTO source_stats (source, total_jobs, notified_jobs)
+                SELECT source, COUNT(*), SUM(notified = 1) FROM jobs GROUP BY source
+            ''')
+    
+    def _seen_index(self) -> SeenJobIndex:
+        """The seen-job index, loaded from the jobs table on first use."""
+        with self.lock:
+            if self.seen is None:
+                self.seen = SeenJobIndex(self.seen_index_capacity, self.seen_index_error_rate)
+                self._load_seen_index()
+            return self.seen
+    
+    def _load_seen_index(self):
+        """(Re)build the seen-job index from the jobs table."""
+        with self.lock:
+            total = self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+            self.seen.load((row[0] for row in self.conn.execute('SELECT job_id FROM jobs')), expected=total)
     
     def job_exists(self, job_id: str) -> bool:
         """Check if a job already exists in the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT 1 FROM jobs WHERE job_id = ?', (job_id,))
-        exists = cursor.fetchone() is not None
-        
-        conn.close()
+        seen = self._seen_index()
+        if not seen.might_contain(job_id):
+            return False
+        exists = bool(self.query('SELECT 1 FROM jobs WHERE job_id = ?', (job_id,)))
+        if not exists:
+            seen.record_false_positive()
         return exists
     
-    def add_job(self, job_data: Dict) -> bool:
+    def add_job(self, job_data: Union[Job, Dict]) -> bool:
         """
         Add a new job to the database.
         Returns True if the job was added, False if it already exists.
         """
-        if self.job_exists(job_data['job_id']):
-            return False
+        return bool(self.add_jobs([job_data]))
+    
+    def add_jobs(self, jobs: List[Union[Job, Dict]]) -> List[Job]:
+        """
+        Insert a batch of jobs in one transaction.
+        Returns exactly the jobs that were new (in input order, as Job records);
+        jobs already in the database, or repeated within the batch, are skipped.
+        """
+        unique = {}
+        for job in jobs:
+            job = Job.coerce(job)
+            unique.setdefault(job.job_id, job)
+        batch = list(unique.values())
+        if not batch:
+            return []
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        created_at = datetime.now().isoformat()
+        new_ids = set()
         
-        try:
-            cursor.execute('''
-                INSERT INTO jobs (job_id, title, company, location, url, 
-                                description, posted_date, source, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data['job_id'],
-                job_data['title'],
-                job_data['company'],
-                job_data.get('location', ''),
-                job_data['url'],
-                job_data.get('description', ''),
-                job_data.get('posted_date', ''),
-                job_data['source'],
-                datetime.now().isoformat()
-            ))
+        with self.lock:
+            # Jobs the index has never seen are definitely new and skip the lookup;
+            # only maybe-seen ids are probed, so a batch of known jobs is
+            # answered by reads and never takes the write lock
+            seen = self._seen_index()
+            maybe_seen = [job.job_id for job in batch if seen.might_contain(job.job_id)]
+            existing = set()
+            for start in range(0, len(maybe_seen), INSERT_CHUNK_SIZE):
+                ids = maybe_seen[start:start + INSERT_CHUNK_SIZE]
+                rows = self.conn.execute(
+                    f'SELECT job_id FROM jobs WHERE job_id IN ({", ".join("?" * len(ids))})', ids
+                ).fetchall()
+                existing.update(row[0] for row in rows)
+            for job_id in maybe_seen:
+                if job_id not in existing:
+                    seen.record_false_positive()
+            fresh = [job for job in batch if job.job_id not in existing]
+            if not fresh:
+                return []
             
-            conn.commit()
-            conn.close()
-            return True
-        except sqlite3.IntegrityError:
-            conn.close()
-            return False
+            with self.transaction() as cursor:
+                for start in range(0, len(fresh), INSERT_CHUNK_SIZE):
+                    chunk = fresh[start:start + INSERT_CHUNK_SIZE]
+                    
+                    if SUPPORTS_RETURNING:
+                        # RETURNING reports only the rows actually inserted, in case
+                        # another process added some of them since the lookup
+                        values = ', '.join(['(?, ?, ?, ?, ?, ?, ?, ?, ?)'] * len(chunk))
+                        params = [value for job in chunk for value in self._job_row(job, created_at)]
+                        cursor.execute(f'''
+                            INSERT INTO jobs ({JOB_COLUMNS})
+                            VALUES {values}
+                            ON CONFLICT(job_id) DO NOTHING
+                            RETURNING job_id
+                        ''', params)
+                        new_ids.update(row[0] for row in cursor.fetchall())
+                    else:
+                        cursor.executemany(f'''
+                            INSERT OR IGNORE INTO jobs ({JOB_COLUMNS})
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ''', [self._job_row(job, created_at) for job in chunk])
+                        new_ids.update(job.job_id for job in chunk)
+                
+                for job_id in new_ids:
+                    seen.add(job_id)
+                if seen.needs_resize:
+                    self._load_seen_index()
+        
+        return [job for job in batch if job.job_id in new_ids]
+    
+    @staticmethod
+    def _job_row(job: Job, created_at: str) -> tuple:
+        """Values for JOB_COLUMNS, in order."""
+        return (
+            job.job_id,
+            job.title,
+            job.company,
+            job.location,
+            job.url,
+            job.description,
+            job.posted_date,
+            job.source,
+            created_at
+        )
     
     def mark_as_notified(self, job_id: str):
         """Mark a job as notified."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('UPDATE jobs SET notified = 1 WHERE job_id = ?', (job_id,))
+        with self.transaction() as cursor:
+            cursor.execute('UPDATE jobs SET notified = 1 WHERE job_id = ?', (job_id,))
+    
+    def mark_many_notified(self, job_ids: List[str]) -> int:
+        """
+        Mark a batch of jobs as notified in one transaction.
+        Returns the number of rows that changed (already-notified jobs are not counted).
+        """
+        return self._mark_notified('job_id', list(dict.fromkeys(job_ids)))
+    
+    def _mark_notified(self, column: str, keys: List) -> int:
+        changed = 0
+        with self.transaction() as cursor:
+            for start in range(0, len(keys), IN_CHUNK_SIZE):
+                chunk = keys[start:start + IN_CHUNK_SIZE]
+                cursor.execute(
+                    f'UPDATE jobs SET notified = 1 WHERE notified = 0 AND {column} IN ({", ".join("?" * len(chunk))})',
+                    chunk
+                )
+                changed += cursor.rowcount
         
-        conn.commit()
-        conn.close()
+        return changed
+    
+    def get_outbox_batch(self, after_id: int = 0, limit: int = 100) -> List[Dict]:
+        """
+        The next `limit` jobs not yet notified with a row id above `after_id`,
+        oldest first. Served from idx_notified (ordered by row id within
+        notified = 0), so pending jobs are found without scanning the table.
+        """
+        rows = self.query('''
+            SELECT * FROM jobs
+            WHERE notified = 0 AND id > ?
+            ORDER BY id
+            LIMIT ?
+        ''', (after_id, limit))
+        return [dict(row) for row in rows]
+    
+    def get_outbox_summary(self) -> Dict:
+        """Number of jobs not yet notified and when the oldest of them was stored."""
+        row = self.query('''
+            SELECT COUNT(*), MIN(created_at) FROM jobs WHERE notified = 0
+        ''')[0]
+        return {'pending': row[0], 'oldest_created_at': row[1]}
+    
+    def mark_outbox_sent(self, ids: List[int]) -> int:
+        """
+        Mark outbox rows (by row id) as notified in one transaction, once their
+        email has been sent, and forget their deliveries. Returns the number of
+        rows that changed.
+        """
+        ids = list(dict.fromkeys(ids))
+        with self.transaction() as cursor:
+            changed = self._mark_notified('id', ids)
+            for start in range(0, len(ids), IN_CHUNK_SIZE):
+                chunk = ids[start:start + IN_CHUNK_SIZE]
+                cursor.execute(f'DELETE FROM deliveries WHERE job_row_id IN ({", ".join("?" * len(chunk))})', chunk)
+        return changed
+    
+    def record_deliveries(self, ids: List[int], emails: List[str]):
+        """Remember that outbox rows `ids` have reached every address in `emails`."""
+        if not ids or not emails:
+            return
+        with self.transaction() as cursor:
+            cursor.executemany(
+                'INSERT OR IGNORE INTO deliveries (job_row_id, email) VALUES (?, ?)',
+                [(row_id, email.strip()) for row_id in ids for email in emails]
+            )
+    
+    def get_deliveries(self, ids: List[int]) -> Dict[int, Set[str]]:
+        """Addresses (lowercased) each of the outbox rows `ids` has already reached."""
+        delivered: Dict[int, Set[str]] = {}
+        ids = list(dict.fromkeys(ids))
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CHUNK_SIZE]
+            rows = self.query(
+                f'SELECT job_row_id, email FROM deliveries WHERE job_row_id IN ({", ".join("?" * len(chunk))})',
+                chunk
+            )
+            for row in rows:
+                delivered.setdefault(row[0], set()).add(row[1].lower())
+        return delivered
     
     def get_unnotified_jobs(self) -> List[Dict]:
         """Get all jobs that haven't been notified yet."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        rows = self.query('''
             SELECT * FROM jobs WHERE notified = 0 ORDER BY created_at DESC
         ''')
-        
-        jobs = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return jobs
+        return [dict(row) for row in rows]
     
     def get_recent_jobs(self, limit: int = 50) -> List[Dict]:
         """Get the most recent jobs."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        rows = self.query('''
             SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?
         ''', (limit,))
-        
-        jobs = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return jobs
+        return [dict(row) for row in rows]
     
     def get_stats(self) -> Dict:
-        """Get database statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs')
-        total_jobs = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE notified = 1')
-        notified_jobs = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(DISTINCT source) FROM jobs')
-        sources = cursor.fetchone()[0]
-        
-        conn.close()
+        """Get database statistics (reads the counters table, not the jobs table)."""
+        row = self.query('''
+            SELECT COALESCE(SUM(total_jobs), 0),
+                   COALESCE(SUM(notified_jobs), 0),
+                   COALESCE(SUM(total_jobs > 0), 0)
+            FROM source_stats
+        ''')[0]
+        total_jobs, notified_jobs, sources = row[0], row[1], row[2]
         
         return {
             'total_jobs': total_jobs,
             'notified_jobs': notified_jobs,
             'pending_notifications': total_jobs - notified_jobs,
-            'sources': sources
+            'sources': sources,
+            # Live counters once add_jobs has loaded the index, otherwise the
+            # sizing it will load with (building it here would scan every job_id)
+            'seen_index': (self.seen.stats() if self.seen is not None else
+                           SeenJobIndex.estimate(total_jobs, self.seen_index_capacity, self.seen_index_error_rate))
         }
+    
+    def get_source_churn(self, days: int = 30) -> Dict[str, int]:
+        """New jobs per source over the last `days` days."""
+        since = (datetime.now() - timedelta(days=days)).isoformat()
+        rows = self.query('''
+            SELECT source, COUNT(*) FROM jobs WHERE created_at >= ? GROUP BY source
+        ''', (since,))
+        return {row[0]: row[1] for row in rows}
+    
+    def get_source_stats(self) -> List[Dict]:
+        """Per-source job counts, largest first."""
+        rows = self.query('''
+            SELECT source, total_jobs, notified_jobs,
+                   total_jobs - notified_jobs AS pending_notifications
+            FROM source_stats WHERE total_jobs > 0
+            ORDER BY total_jobs DESC, source
+        ''')
+        return [dict(row) for row in rows]
+    
+    def load_board_health(self) -> List[Dict]:
+        """All board health entries."""
+        rows = self.query(f'SELECT {", ".join(BOARD_HEALTH_COLUMNS)} FROM board_health')
+        return [dict(row) for row in rows]
+    
+    def save_board_health(self, entries: List[Dict]):
+        """Insert or replace board health entries in one transaction."""
+        if not entries:
+            return
+        
+        columns = ', '.join(BOARD_HEALTH_COLUMNS)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in BOARD_HEALTH_COLUMNS[1:])
+        with self.transaction() as cursor:
+            cursor.executemany(f'''
+                INSERT INTO board_health ({columns})
+                VALUES ({", ".join("?" * len(BOARD_HEALTH_COLUMNS))})
+                ON CONFLICT(board_key) DO UPDATE SET {updates}
+            ''', [tuple(entry[column] for column in BOARD_HEALTH_COLUMNS) for entry in entries])
+    
+    def get_subscriptions(self) -> List[Dict]:
+        """All subscriptions, oldest first, with their filter lists decoded."""
+        rows = self.query('SELECT email, keywords, locations, companies FROM subscriptions ORDER BY rowid')
+        return [
+            {
+                'email': row['email'],
+                'keywords': json.loads(row['keywords']),
+                'locations': json.loads(row['locations']),
+                'companies': json.loads(row['companies']),
+            }
+            for row in rows
+        ]
+    
+    def save_subscriptions(self, subscriptions: List[Dict]):
+        """Insert or update subscriptions (by email) in one transaction."""
+        if not subscriptions:
+            return
+        
+        created_at = datetime.now().isoformat()
+        with self.transaction() as cursor:
+            cursor.executemany('''
+                INSERT INTO subscriptions (email, keywords, locations, companies, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET
+                    keywords = excluded.keywords,
+                    locations = excluded.locations,
+                    companies = excluded.companies
+            ''', [
+                (
+                    subscription['email'].strip(),
+                    json.dumps(list(subscription.get('keywords') or [])),
+                    json.dumps(list(subscription.get('locations') or [])),
+                    json.dumps(list(subscription.get('companies') or [])),
+                    created_at
+                )
+                for subscription in subscriptions
+            ])
+    
+    def delete_subscription(self, email: str) -> bool:
+        """Remove a subscription; returns False if there was none."""
+        with self.transaction() as cursor:
+            cursor.execute('DELETE FROM subscriptions WHERE email = ?', (email.strip(),))
+            return cursor.rowcount > 0
+    
+    def get_failing_boards(self, limit: int = 10) -> List[Dict]:
+        """Boards with consecutive failures, worst first."""
+        rows = self.query('''
+            SELECT * FROM board_health WHERE consecutive_failures > 0
+            ORDER BY consecutive_failures DESC, board_key LIMIT ?
+        ''', (limit,))
+        return [dict(row) for row in rows]
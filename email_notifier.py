@@ -1,204 +1,313 @@
 """
 Email notification module for sending job alerts.
 """
-import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict
+from html import escape
+from typing import Callable, List, Dict, Tuple, Union
 from datetime import datetime
 
+from models import Job
+from smtp_delivery import DeliveryResult, DeliveryWorker, SMTPSession, parse_recipients, send_each
+
+# Static parts of the HTML alert, built once at import. Only the header
+# counts/date and the job cards are rendered per message.
+HTML_STYLE = (
+    "body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,Oxygen,Ubuntu,Cantarell,sans-serif;"
+    "line-height:1.6;color:#333;max-width:800px;margin:0 auto;padding:20px}"
+    ".header{background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;padding:30px;"
+    "border-radius:10px;margin-bottom:30px;text-align:center}"
+    ".job-card{border:1px solid #e0e0e0;border-radius:8px;padding:20px;margin-bottom:20px;background:white;"
+    "box-shadow:0 2px 4px rgba(0,0,0,0.1);transition:transform 0.2s}"
+    ".job-card:hover{transform:translateY(-2px);box-shadow:0 4px 8px rgba(0,0,0,0.15)}"
+    ".job-title{font-size:20px;font-weight:bold;color:#2c3e50;margin-bottom:10px}"
+    ".job-company{font-size:16px;color:#667eea;margin-bottom:8px}"
+    ".job-details{font-size:14px;color:#666;margin-bottom:5px}"
+    ".apply-button{display:inline-block;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;"
+    "padding:12px 24px;text-decoration:none;border-radius:5px;margin-top:15px;font-weight:bold}"
+    ".apply-button:hover{background:linear-gradient(135deg,#764ba2 0%,#667eea 100%)}"
+    ".footer{text-align:center;margin-top:40px;padding-top:20px;border-top:1px solid #e0e0e0;color:#666;font-size:14px}"
+    ".badge{display:inline-block;background:#f0f0f0;padding:4px 12px;border-radius:12px;font-size:12px;"
+    "margin-right:8px;color:#666}"
+)
+
+HTML_HEAD = f'<!DOCTYPE html>\n<html>\n<head><style>{HTML_STYLE}</style></head>\n<body>\n'
+
+HTML_HEADER = (
+    '<div class="header">\n'
+    '<h1>🚨 New Job Alert!</h1>\n'
+    '<p>Found {count} new job{plural} matching your criteria{part}</p>\n'
+    '<p style="font-size: 14px; opacity: 0.9;">{date}</p>\n'
+    '</div>\n'
+).format
+
+HTML_JOB_CARD = (
+    '<div class="job-card">\n'
+    '<div class="job-title">{title}</div>\n'
+    '<div class="job-company">🏢 {company}</div>\n'
+    '<div class="job-details">'
+    '<span class="badge">📍 {location}</span>'
+    '<span class="badge">🔗 {source}</span>'
+    '</div>\n'
+    '{description}'
+    '<a href="{url}" class="apply-button">Apply Now →</a>\n'
+    '</div>\n'
+).format
+
+HTML_DESCRIPTION = '<div class="job-details" style="margin-top: 10px;">{}...</div>\n'.format
+
+HTML_FOOTER = (
+    '<div class="footer">\n'
+    '<p>This is an automated job alert from your Job Alert System.</p>\n'
+    '<p>Apply early to increase your chances! 🚀</p>\n'
+    '</div>\n'
+    '</body>\n'
+    '</html>\n'
+)
+
+TEXT_JOB = '{index}. {title}\n   Company: {company}\n   Location: {location}\n   Source: {source}\n   URL: {url}\n\n'.format
+
+# Bytes reserved for the message and MIME part headers and the
+# per-message alert headers
+HEADER_ALLOWANCE = 2048
+
+# MIMEText base64-encodes UTF-8 bodies: 4 bytes per 3, plus a line break
+# every 76 characters (CRLF on the wire)
+ENCODED_SIZE_FACTOR = 4 / 3 * 78 / 76
+
+
+def _html_card(job: Job) -> str:
+    """HTML card for one job; every field is escaped."""
+    return HTML_JOB_CARD(
+        title=escape(job.title or ''),
+        company=escape(job.company or ''),
+        location=escape(job.location or 'N/A'),
+        source=escape((job.source or '').title()),
+        description=HTML_DESCRIPTION(escape(job.description[:200])) if job.description else '',
+        url=escape(job.url or '', quote=True)
+    )
+
+
+def _text_card(index: int, job: Job) -> str:
+    return TEXT_JOB(
+        index=index,
+        title=job.title,
+        company=job.company,
+        location=job.location or 'N/A',
+        source=job.source,
+        url=job.url
+    )
+
+
+def _after_all(recipients: List[str], count: int, on_sent: Callable[[DeliveryResult], None],
+               on_failed: Callable[[DeliveryResult], None]) -> Callable[[DeliveryResult], None]:
+    """
+    A function that collects the results of an alert's `count` messages and,
+    on the last one, reports the merged result to `on_sent` (nothing left to
+    retry) or `on_failed`.
+    """
+    lock = threading.Lock()
+    results = []
+    
+    def done(result: DeliveryResult):
+        with lock:
+            results.append(result)
+            last = len(results) == count
+        if not last:
+            return
+        merged = DeliveryResult.merge(recipients, results)
+        callback = on_failed if merged.failed else on_sent
+        if callback is not None:
+            callback(merged)
+    return done
+
 
 class EmailNotifier:
-    def __init__(self, smtp_server: str, smtp_port: int, 
-                 sender_email: str, sender_password: str, recipient_email: str):
+    def __init__(self, smtp_server: str, smtp_port: int,
+                 sender_email: str, sender_password: str, recipient_email: Union[str, List[str]],
+                 background: bool = False, timeout: float = 30, max_attempts: int = 5,
+                 retry_backoff_seconds: float = 5, idle_seconds: float = 60,
+                 max_email_bytes: int = 100000):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
-        self.recipient_email = recipient_email
+        # One address, a comma-separated string or a list
+        self.recipients = parse_recipients(recipient_email)
+        self.recipient_email = ', '.join(self.recipients)
+        self.timeout = timeout
+        # Alerts whose encoded message would exceed this are split into
+        # several messages (Gmail clips messages above ~100 KB)
+        self.max_email_bytes = max_email_bytes
+        
+        # With background=True alerts are queued and sent by a worker thread
+        # over one persistent connection
+        self.delivery = None
+        if background:
+            self.delivery = DeliveryWorker(
+                self._session(),
+                max_attempts=max_attempts,
+                retry_backoff_seconds=retry_backoff_seconds,
+                idle_seconds=idle_seconds
+            )
+    
+    def _session(self) -> SMTPSession:
+        return SMTPSession(self.smtp_server, self.smtp_port, self.sender_email,
+                           self.sender_password, timeout=self.timeout)
     
-    def send_job_alert(self, jobs: List[Dict]) -> bool:
+    def send_job_alert(self, jobs: List[Union[Job, Dict]], on_sent: Callable[[DeliveryResult], None] = None,
+                       on_failed: Callable[[DeliveryResult], None] = None, recipients: List[str] = None) -> bool:
         """
-        Send an email alert with new job listings.
+        Send an email alert with new job listings (Job records or job dictionaries)
+        to `recipients` (default: the configured recipient_email).
+        Large alerts are sent as several messages.
+        In background mode the alert is queued and True means it was accepted.
+        Once every message is done with, one callback gets the per-recipient
+        DeliveryResult (a recipient counts as delivered only if every message
+        reached it): `on_sent` if no recipient is left to retry, `on_failed`
+        otherwise.
         Returns True if successful, False otherwise.
         """
         if not jobs:
             return False
-        
-        subject = f"🚨 Job Alert: {len(jobs)} New Job{'s' if len(jobs) > 1 else ''} Found!"
-        html_content = self._create_html_email(jobs)
+        recipients = self.recipients if recipients is None else recipients
+        if not recipients:
+            print("✗ Failed to send email: no recipient_email configured")
+            return False
+        jobs = [Job.coerce(job) for job in jobs]
         
         try:
+            messages = self.build_job_alerts(jobs)
+        except Exception as e:
+            print(f"✗ Failed to build email: {str(e)}")
+            return False
+        
+        if self.delivery is not None:
+            done = _after_all(recipients, len(messages), on_sent, on_failed)
+            for msg in messages:
+                self.delivery.submit(msg, recipients, done, done)
+            print(f"📤 Email queued for delivery: {len(jobs)} job(s) in {len(messages)} message(s)")
+            return True
+        
+        results = []
+        for msg in messages:
+            # Recipients a previous part failed for are not sent the rest
+            result = DeliveryResult.merge(recipients, results)
+            results.append(self.deliver_now(msg, result.delivered))
+        result = DeliveryResult.merge(recipients, results)
+        if result.failed:
+            if on_failed is not None:
+                on_failed(result)
+            return False
+        if result.delivered:
+            print(f"✓ Email sent successfully: {len(jobs)} job(s) in {len(messages)} message(s)")
+        if on_sent is not None:
+            on_sent(result)
+        return True
+    
+    def build_job_alerts(self, jobs: List[Job]) -> List[MIMEMultipart]:
+        """
+        The alert messages for `jobs` (To is set per recipient when sending).
+        Jobs are split across messages so that each message, once its bodies
+        are encoded, stays within max_email_bytes (a single oversized job
+        still gets a message).
+        """
+        now = datetime.now()
+        # Budget in rendered bytes for the job entries of one message
+        budget = ((self.max_email_bytes - HEADER_ALLOWANCE) / ENCODED_SIZE_FACTOR
+                  - len(HTML_HEAD.encode()) - len(HTML_FOOTER.encode()))
+        
+        chunks: List[Tuple[List[Job], List[str], List[str]]] = []
+        chunk_jobs, html_cards, text_cards = [], [], []
+        size = 0
+        for index, job in enumerate(jobs, 1):
+            html_card = _html_card(job)
+            text_card = _text_card(index, job)
+            card_size = len(html_card.encode()) + len(text_card.encode())
+            if chunk_jobs and size + card_size > budget:
+                chunks.append((chunk_jobs, html_cards, text_cards))
+                chunk_jobs, html_cards, text_cards = [], [], []
+                size = 0
+            chunk_jobs.append(job)
+            html_cards.append(html_card)
+            text_cards.append(text_card)
+            size += card_size
+        chunks.append((chunk_jobs, html_cards, text_cards))
+        
+        messages = []
+        for number, (chunk_jobs, html_cards, text_cards) in enumerate(chunks, 1):
+            part = f" (part {number}/{len(chunks)})" if len(chunks) > 1 else ''
+            subject = f"🚨 Job Alert: {len(jobs)} New Job{'s' if len(jobs) > 1 else ''} Found!{part}"
+            
             msg = MIMEMultipart('alternative')
             msg['Subject'] = subject
             msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
             
             # Create plain text version
-            text_content = self._create_text_email(jobs)
-            part1 = MIMEText(text_content, 'plain')
-            part2 = MIMEText(html_content, 'html')
+            part1 = MIMEText(self._create_text_email(text_cards, now, part), 'plain')
+            part2 = MIMEText(self._create_html_email(html_cards, len(jobs), now, part), 'html')
             
             msg.attach(part1)
             msg.attach(part2)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            print(f"✓ Email sent successfully: {len(jobs)} job(s)")
-            return True
-            
-        except Exception as e:
-            print(f"✗ Failed to send email: {str(e)}")
+            messages.append(msg)
+        return messages
+    
+    def send_now(self, msg: MIMEMultipart, recipients: List[str] = None) -> bool:
+        """Send a message to every recipient on this thread; True if all of them got it."""
+        recipients = self.recipients if recipients is None else recipients
+        if not recipients:
+            print("✗ Failed to send email: no recipient_email configured")
             return False
+        result = self.deliver_now(msg, recipients)
+        return not result.failed and not result.refused
     
-    def _create_text_email(self, jobs: List[Dict]) -> str:
-        """Create plain text version of the email."""
-        lines = [
-            f"New Job Alert - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "=" * 60,
-            ""
-        ]
-        
-        for i, job in enumerate(jobs, 1):
-            lines.append(f"{i}. {job['title']}")
-            lines.append(f"   Company: {job['company']}")
-            lines.append(f"   Location: {job.get('location', 'N/A')}")
-            lines.append(f"   Source: {job['source']}")
-            lines.append(f"   URL: {job['url']}")
-            lines.append("")
-        
-        return "\n".join(lines)
+    def deliver_now(self, msg: MIMEMultipart, recipients: List[str]) -> DeliveryResult:
+        """Send a message to each recipient on this thread, over one connection."""
+        session = self._session()
+        try:
+            result, error = send_each(session, msg, recipients)
+        finally:
+            session.close()
+        if error is not None:
+            print(f"✗ Failed to send email: {str(error)}")
+        return result
     
-    def _create_html_email(self, jobs: List[Dict]) -> str:
-        """Create HTML version of the email with better formatting."""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-bottom: 30px;
-                    text-align: center;
-                }}
-                .job-card {{
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                    padding: 20px;
-                    margin-bottom: 20px;
-                    background: white;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    transition: transform 0.2s;
-                }}
-                .job-card:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-                }}
-                .job-title {{
-                    font-size: 20px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    margin-bottom: 10px;
-                }}
-                .job-company {{
-                    font-size: 16px;
-                    color: #667eea;
-                    margin-bottom: 8px;
-                }}
-                .job-details {{
-                    font-size: 14px;
-                    color: #666;
-                    margin-bottom: 5px;
-                }}
-                .apply-button {{
-                    display: inline-block;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 12px 24px;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin-top: 15px;
-                    font-weight: bold;
-                }}
-                .apply-button:hover {{
-                    background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid #e0e0e0;
-                    color: #666;
-                    font-size: 14px;
-                }}
-                .badge {{
-                    display: inline-block;
-                    background: #f0f0f0;
-                    padding: 4px 12px;
-                    border-radius: 12px;
-                    font-size: 12px;
-                    margin-right: 8px;
-                    color: #666;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🚨 New Job Alert!</h1>
-                <p>Found {len(jobs)} new job{'s' if len(jobs) > 1 else ''} matching your criteria</p>
-                <p style="font-size: 14px; opacity: 0.9;">{datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-            </div>
-        """
-        
-        for job in jobs:
-            html += f"""
-            <div class="job-card">
-                <div class="job-title">{job['title']}</div>
-                <div class="job-company">🏢 {job['company']}</div>
-                <div class="job-details">
-                    <span class="badge">📍 {job.get('location', 'N/A')}</span>
-                    <span class="badge">🔗 {job['source'].title()}</span>
-                </div>
-                {f'<div class="job-details" style="margin-top: 10px;">{job.get("description", "")[:200]}...</div>' if job.get('description') else ''}
-                <a href="{job['url']}" class="apply-button">Apply Now →</a>
-            </div>
-            """
-        
-        html += """
-            <div class="footer">
-                <p>This is an automated job alert from your Job Alert System.</p>
-                <p>Apply early to increase your chances! 🚀</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+    def flush(self, timeout: float = None) -> bool:
+        """Wait for queued alerts to be delivered (no-op without background delivery)."""
+        return self.delivery is None or self.delivery.flush(timeout)
+    
+    def close(self, timeout: float = None) -> bool:
+        """Deliver queued alerts (up to `timeout` seconds) and stop the worker."""
+        if self.delivery is None:
+            return True
+        return self.delivery.close(timeout)
+    
+    def _create_text_email(self, text_cards: List[str], now: datetime, part: str = '') -> str:
+        """Create plain text version of the email from rendered job entries."""
+        header = f"New Job Alert{part} - {now.strftime('%Y-%m-%d %H:%M')}\n{'=' * 60}\n\n"
+        return header + ''.join(text_cards)
+    
+    def _create_html_email(self, html_cards: List[str], total: int, now: datetime, part: str = '') -> str:
+        """Create HTML version of the email from rendered job cards."""
+        header = HTML_HEADER(
+            count=total,
+            plural='s' if total > 1 else '',
+            part=part,
+            date=now.strftime('%B %d, %Y at %I:%M %p')
+        )
+        return ''.join((HTML_HEAD, header, ''.join(html_cards), HTML_FOOTER))
     
     def send_test_email(self) -> bool:
-        """Send a test email to verify configuration."""
-        test_job = [{
-            'title': 'Test Job Posting',
-            'company': 'Test Company',
-            'location': 'Remote',
-            'url': 'https://example.com',
-            'source': 'test',
-            'description': 'This is a test email to verify your job alert system is working correctly.'
-        }]
+        """Send a test email to verify configuration (always synchronously)."""
+        test_job = [Job(
+            job_id='test',
+            title='Test Job Posting',
+            company='Test Company',
+            location='Remote',
+            url='https://example.com',
+            source='test',
+            description='This is a test email to verify your job alert system is working correctly.'
+        )]
         
-        return self.send_job_alert(test_job)
+        return self.send_now(self.build_job_alerts(test_job)[0])
@@ -0,0 +1,104 @@
+"""
+Concurrent scrape engine.
+Runs every scraper in parallel; each scraper fans its boards out through its
+own bounded worker pool, so a cycle takes about as long as the slowest host.
+"""
+import queue
+import threading
+from typing import Callable, List, Iterator, NamedTuple, Optional
+
+from models import Job
+from scrapers import JobScraper
+
+
+class ScrapeEvent(NamedTuple):
+    """
+    One item from ScrapeEngine.stream: either a batch of jobs from one board,
+    or (finished=True) the end of a scraper's run. The consumer calls
+    `commit` (if set) once the batch's jobs have been stored.
+    """
+    name: str
+    jobs: List[Job]
+    finished: bool = False
+    total: int = 0
+    error: Optional[Exception] = None
+    commit: Optional[Callable[[], None]] = None
+
+
+def scraper_name(scraper: JobScraper) -> str:
+    """Human readable name used in log output (e.g. 'Greenhouse')."""
+    return getattr(scraper, 'name', None) or scraper.__class__.__name__.replace('Scraper', '')
+
+
+class ScrapeEngine:
+    def __init__(self, scrapers: List[JobScraper]):
+        self.scrapers = scrapers
+    
+    def board_keys(self, keywords: List[str], locations: List[str]) -> List[str]:
+        """Keys of every board the scrapers would fetch (see JobScraper.board_key)."""
+        keys = []
+        for scraper in self.scrapers:
+            keys.extend(scraper.board_keys(keywords, locations))
+        return keys
+    
+    def _stream_scraper(self, scraper: JobScraper, keywords: List[str], locations: List[str],
+                        max_jobs: int, events: queue.Queue, stop: threading.Event):
+        name = scraper_name(scraper)
+        total = 0
+        batches = scraper.iter_board_jobs(keywords, locations, max_jobs)
+        try:
+            for result in batches:
+                total += len(result.jobs)
+                if not self._put(events, ScrapeEvent(name, result.jobs, commit=result.commit), stop):
+                    return
+            event = ScrapeEvent(name, [], finished=True, total=total)
+        except Exception as e:
+            event = ScrapeEvent(name, [], finished=True, total=total, error=e)
+        finally:
+            # Stops the scraper's remaining boards if the consumer has gone away
+            batches.close()
+        self._put(events, event, stop)
+    
+    @staticmethod
+    def _put(events: queue.Queue, event: ScrapeEvent, stop: threading.Event) -> bool:
+        """Queue an event, waiting for room; False once the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                events.put(event, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def stream(self, keywords: List[str], locations: List[str], max_jobs: int,
+               max_pending: int = 256) -> Iterator[ScrapeEvent]:
+        """
+        Run all scrapers concurrently and yield their jobs board by board, as
+        soon as each board is parsed. Every scraper ends with a finished event.
+        At most `max_pending` batches are buffered before scrapers wait for
+        the consumer. If the consumer stops early (or raises), closing the
+        generator tells the scrapers to stop instead of waiting for room.
+        """
+        events = queue.Queue(maxsize=max_pending)
+        stop = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self._stream_scraper,
+                args=(scraper, keywords, locations, max_jobs, events, stop),
+                name=f'scrape-{scraper_name(scraper)}',
+                daemon=True
+            )
+            for scraper in self.scrapers
+        ]
+        for thread in threads:
+            thread.start()
+        
+        running = len(threads)
+        try:
+            while running:
+                event = events.get()
+                if event.finished:
+                    running -= 1
+                yield event
+        finally:
+            stop.set()
@@ -0,0 +1,78 @@
+"""
+Per-board content fingerprints.
+Hosts that ignore conditional requests still let us skip re-parsing a board
+whose response body is byte-for-byte the same as last cycle.
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict
+
+
+def fingerprint_path(db_path: str) -> str:
+    """Fingerprint file stored next to the jobs database (jobs.db -> jobs.fingerprints.json)."""
+    return f"{os.path.splitext(db_path)[0]}.fingerprints.json"
+
+
+class BoardFingerprintStore:
+    """Thread-safe map of board key -> last seen content fingerprint, saved as JSON."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.boards: Dict[str, Dict] = {}
+        self.checked = 0
+        self.changed = 0
+        self.load()
+    
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.boards = json.load(f)
+        except (OSError, ValueError):
+            self.boards = {}
+    
+    def save(self):
+        """Persist fingerprints (write to a temp file, then rename)."""
+        with self.lock:
+            data = json.dumps(self.boards)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+    
+    def begin_cycle(self):
+        """Reset the per-cycle counters."""
+        with self.lock:
+            self.checked = 0
+            self.changed = 0
+    
+    def is_unchanged(self, key: str, fingerprint: str) -> bool:
+        """True if the board had exactly this fingerprint last time it was parsed."""
+        with self.lock:
+            self.checked += 1
+            entry = self.boards.get(key)
+            if entry is not None and entry['fingerprint'] == fingerprint:
+                entry['checked_at'] = time.time()
+                return True
+            self.changed += 1
+            return False
+    
+    def not_modified(self, key: str):
+        """Count a board the server reported as unchanged (HTTP 304)."""
+        with self.lock:
+            self.checked += 1
+            entry = self.boards.get(key)
+            if entry is not None:
+                entry['checked_at'] = time.time()
+    
+    def update(self, key: str, fingerprint: str):
+        """Record a board's new fingerprint once its jobs have been stored."""
+        now = time.time()
+        with self.lock:
+            self.boards[key] = {'fingerprint': fingerprint, 'checked_at': now, 'changed_at': now}
+    
+    def cycle_stats(self) -> Dict:
+        with self.lock:
+            return {'boards_checked': self.checked, 'boards_changed': self.changed}
@@ -0,0 +1,85 @@
+"""
+On-disk HTTP validator cache.
+Stores the ETag / Last-Modified of each board response so the next check can
+send a conditional request and skip parsing on 304 Not Modified.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    One <sha1(url)>.json metadata file per URL.
+    `variant` identifies the search filters the response was parsed with; a cached
+    entry is only used when the variant matches, so changing keywords or
+    locations forces a full fetch.
+    """
+    
+    def __init__(self, cache_dir: str = '.http_cache'):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+    
+    def _load_meta(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._path(url, 'json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def conditional_headers(self, url: str, variant: str = '') -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a previously seen URL."""
+        meta = self._load_meta(url)
+        if not meta or meta.get('variant') != variant:
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def store(self, url: str, headers, variant: str = ''):
+        """
+        Remember the validators of a 200 response; responses without them are
+        not cached. Call only once the board's jobs have been stored, or a
+        later 304 would skip jobs that never made it into the database.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'variant': variant,
+            'stored_at': time.time(),
+        }
+        self._write(self._path(url, 'json'), json.dumps(meta).encode())
+    
+    def record(self, not_modified: bool):
+        with self.lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def _write(self, path: str, data: bytes):
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+"""
+Incremental decoding of the Greenhouse and Lever board APIs.
+Large boards return thousands of postings with full HTML descriptions, of
+which the scrapers only look at the first `max_jobs` and a few fields. With
+ijson (in requirements.txt; used only with its C backend) postings are read
+one at a time, only the requested fields are kept, and decoding stops once
+`max_jobs` postings have been seen. Without it the payload is decoded in one
+go, with orjson if it is installed and the standard library otherwise.
+"""
+import io
+import json
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import ijson
+    # The pure-Python backend is slower than decoding the whole payload
+    if ijson.backend not in ('yajl2_c', 'yajl2_cffi'):
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCALAR_EVENTS = ('string', 'number', 'boolean', 'null')
+
+
+def loads(content: bytes):
+    """Decode a whole JSON document (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _array_at(data, prefix: str) -> List:
+    """The array an ijson-style prefix ('item', 'jobs.item') points at."""
+    for key in prefix.split('.')[:-1]:
+        data = data.get(key) if isinstance(data, dict) else None
+    return data if isinstance(data, list) else []
+
+
+def _lookup(record, path: str):
+    """Scalar at a dotted path in a decoded record, or None."""
+    for key in path.split('.'):
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+    return None if isinstance(record, (dict, list)) else record
+
+
+def _truncate(value, length: Optional[int]):
+    if length is not None and isinstance(value, str):
+        return value[:length]
+    return value
+
+
+def iter_records(content: bytes, prefix: str, fields: Dict[str, str], limit: int,
+                 truncate: Dict[str, int] = None) -> Iterator[Dict]:
+    """
+    Yield the first `limit` entries of the array at `prefix` ('item' for a
+    top-level array, 'jobs.item' for {"jobs": [...]}) as small dictionaries.
+    `fields` maps dotted paths inside an entry to output names; several paths
+    may share a name, and the first one present wins. Only scalar values are
+    kept, and string fields named in `truncate` are cut to that length.
+    Entries that are not objects count towards `limit` but are not yielded.
+    """
+    truncate = truncate or {}
+    if limit <= 0:
+        return
+    
+    if ijson is None:
+        for entry in islice(_array_at(loads(content), prefix), limit):
+            if not isinstance(entry, dict):
+                continue
+            record = {}
+            for path, name in fields.items():
+                if record.get(name) is None:
+                    record[name] = _truncate(_lookup(entry, path), truncate.get(name))
+            yield record
+        return
+    
+    record = None
+    seen = 0
+    start = len(prefix) + 1
+    for path, event, value in ijson.parse(io.BytesIO(content), use_float=True):
+        if path == prefix:
+            # An entry ends with end_map (object), end_array (nested array) or a scalar
+            if event == 'start_map':
+                record = dict.fromkeys(fields.values())
+                continue
+            if event == 'end_map':
+                yield record
+                record = None
+            elif event != 'end_array' and event not in SCALAR_EVENTS:
+                continue
+            seen += 1
+            if seen >= limit:
+                return
+        elif record is not None and event in SCALAR_EVENTS:
+            name = fields.get(path[start:])
+            if name is not None and record[name] is None:
+                record[name] = _truncate(value, truncate.get(name))
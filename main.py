@@ -3,8 +3,6 @@ Main job alert system.
 This script monitors job boards and sends email notifications for new postings.
 """
 import sys
-import time
-import schedule
 from datetime import datetime
 from typing import List, Dict
 
@@ -16,35 +14,119 @@ except ImportError:
     from config import EMAIL_CONFIG, JOB_SEARCH_CONFIG, JOB_BOARDS, SCRAPING_CONFIG, DATABASE_CONFIG
 
 from database import JobDatabase
+from board_health import BoardHealthTracker
+from poll_planner import PollPlanner
+from scheduler import Scheduler
+from fingerprints import BoardFingerprintStore, fingerprint_path
 from email_notifier import EmailNotifier
+from outbox import NotificationOutbox
+from companies import PRIORITY_COMPANIES
+from subscriptions import Subscription, SubscriptionIndex
 from scrapers import get_all_scrapers
+from engine import ScrapeEngine
 
 
 class JobAlertSystem:
     def __init__(self):
-        self.db = JobDatabase(DATABASE_CONFIG['db_path'])
+        self.db = JobDatabase(
+            DATABASE_CONFIG['db_path'],
+            journal_mode=DATABASE_CONFIG.get('journal_mode', 'WAL'),
+            synchronous=DATABASE_CONFIG.get('synchronous', 'NORMAL'),
+            cache_size=DATABASE_CONFIG.get('cache_size', -16000),
+            seen_index_capacity=DATABASE_CONFIG.get('seen_index_capacity', 100000),
+            seen_index_error_rate=DATABASE_CONFIG.get('seen_index_error_rate', 0.001)
+        )
         self.notifier = EmailNotifier(
             smtp_server=EMAIL_CONFIG['smtp_server'],
             smtp_port=EMAIL_CONFIG['smtp_port'],
             sender_email=EMAIL_CONFIG['sender_email'],
             sender_password=EMAIL_CONFIG['sender_password'],
-            recipient_email=EMAIL_CONFIG['recipient_email']
+            recipient_email=EMAIL_CONFIG['recipient_email'],
+            background=EMAIL_CONFIG.get('background_delivery', True),
+            timeout=EMAIL_CONFIG.get('smtp_timeout', 30),
+            max_attempts=EMAIL_CONFIG.get('send_attempts', 5),
+            retry_backoff_seconds=EMAIL_CONFIG.get('retry_backoff_seconds', 5),
+            idle_seconds=EMAIL_CONFIG.get('smtp_idle_seconds', 60),
+            max_email_bytes=EMAIL_CONFIG.get('max_email_bytes', 100000)
+        )
+        
+        # Subscribers (added with `main.py subscribe`, or seeded from
+        # JOB_SEARCH_CONFIG['subscriptions'] while there are none) each get
+        # their own digest; without any, alerts go to recipient_email for the
+        # global keywords and locations
+        stored = self.db.get_subscriptions()
+        if not stored and JOB_SEARCH_CONFIG.get('subscriptions'):
+            self.db.save_subscriptions(JOB_SEARCH_CONFIG['subscriptions'])
+            stored = self.db.get_subscriptions()
+        self.subscriptions = SubscriptionIndex(Subscription.from_dict(entry) for entry in stored) if stored else None
+        
+        # Pending jobs are emailed from the database, so none are lost if the
+        # process stops before (or while) sending
+        self.outbox = NotificationOutbox(
+            self.db,
+            self.notifier,
+            batch_size=EMAIL_CONFIG.get('outbox_batch_size', 100),
+            max_batches=EMAIL_CONFIG.get('outbox_max_emails_per_check', 10),
+            digest_window_minutes=EMAIL_CONFIG.get('digest_window_minutes', 0),
+            digest_max_jobs=EMAIL_CONFIG.get('digest_max_jobs'),
+            priority_companies=EMAIL_CONFIG.get('priority_companies', PRIORITY_COMPANIES),
+            subscriptions=self.subscriptions
         )
         
+        self.fingerprints = BoardFingerprintStore(fingerprint_path(DATABASE_CONFIG['db_path']))
+        health_entries = self.db.load_board_health()
+        self.board_health = BoardHealthTracker(
+            health_entries,
+            backoff_minutes=SCRAPING_CONFIG.get('board_backoff_minutes', 30),
+            max_backoff_hours=SCRAPING_CONFIG.get('board_backoff_max_hours', 24)
+        )
+        self.poll_planner = PollPlanner(
+            max_requests=SCRAPING_CONFIG.get('max_board_requests_per_check'),
+            max_interval_hours=SCRAPING_CONFIG.get('max_board_interval_hours', 24),
+            window_days=SCRAPING_CONFIG.get('churn_window_days', 30),
+            health=self.board_health,
+            entries=health_entries
+        )
+        
+        indeed_searches = None
+        if self.subscriptions is not None:
+            # Scrape for every subscriber at once; jobs are routed to them when emailed.
+            # Indeed runs each subscriber's own searches rather than every
+            # combination of everyone's terms
+            self.keywords, self.locations = self.subscriptions.search_terms()
+            indeed_searches = self.subscriptions.searches(JOB_SEARCH_CONFIG['keywords'], JOB_SEARCH_CONFIG['locations'])
+        else:
+            self.keywords = JOB_SEARCH_CONFIG['keywords']
+            self.locations = JOB_SEARCH_CONFIG['locations']
+        
         scraper_config = {
             'user_agent': SCRAPING_CONFIG['user_agent'],
-            'job_boards': JOB_BOARDS
+            'job_boards': JOB_BOARDS,
+            'fetch_workers': SCRAPING_CONFIG.get('fetch_workers', 8),
+            'parse_workers': SCRAPING_CONFIG.get('parse_workers', 0),
+            'rate_limits': SCRAPING_CONFIG.get('rate_limits'),
+            'http_backend': SCRAPING_CONFIG.get('http_backend', 'sync'),
+            'max_connections': SCRAPING_CONFIG.get('max_connections', 100),
+            'http_cache_dir': SCRAPING_CONFIG.get('http_cache_dir', '.http_cache'),
+            'fingerprints': self.fingerprints,
+            'html_parser': SCRAPING_CONFIG.get('html_parser', 'auto'),
+            'companies_file': SCRAPING_CONFIG.get('companies_file'),
+            'board_health': self.board_health,
+            'poll_planner': self.poll_planner,
+            'indeed_searches': indeed_searches,
         }
         self.scrapers = get_all_scrapers(scraper_config)
+        self.engine = ScrapeEngine(self.scrapers)
         
-        self.keywords = JOB_SEARCH_CONFIG['keywords']
-        self.locations = JOB_SEARCH_CONFIG['locations']
         self.max_jobs = SCRAPING_CONFIG['max_jobs_per_check']
+        self.scheduler = Scheduler()
         
         print("✓ Job Alert System initialized")
         print(f"✓ Monitoring {len(self.scrapers)} job board(s)")
-        print(f"✓ Keywords: {', '.join(self.keywords)}")
-        print(f"✓ Locations: {', '.join(self.locations)}")
+        print(f"✓ Keywords: {', '.join(self.keywords) or 'any'}")
+        print(f"✓ Locations: {', '.join(self.locations) or 'any'}")
+        if self.subscriptions is not None:
+            print(f"✓ Subscribers: {len(self.subscriptions)} ({len(indeed_searches)} Indeed search(es))")
     
     def check_for_jobs(self):
         """Main function to check for new jobs and send notifications."""
@@ -52,51 +134,67 @@ class JobAlertSystem:
         print(f"🔍 Checking for new jobs at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
         
-        all_new_jobs = []
+        self.fingerprints.begin_cycle()
+        self.board_health.begin_cycle()
         
-        # Scrape jobs from all enabled job boards
-        for scraper in self.scrapers:
-            scraper_name = scraper.__class__.__name__.replace('Scraper', '')
-            print(f"\n📊 Scraping {scraper_name}...")
-            
-            try:
-                jobs = scraper.scrape_jobs(
-                    keywords=self.keywords,
-                    locations=self.locations,
-                    max_jobs=self.max_jobs
-                )
-                
-                print(f"✓ Found {len(jobs)} job(s) from {scraper_name}")
+        # Spend this cycle's request budget on the boards most likely to have new postings
+        board_keys = self.engine.board_keys(self.keywords, self.locations)
+        due = self.poll_planner.plan(board_keys, self.db.get_source_churn(self.poll_planner.window_days))
+        if len(due) < len(board_keys):
+            print(f"\n🗓️  Polling {len(due)} of {len(board_keys)} board(s) this cycle")
+        
+        # Scrape all enabled job boards concurrently, storing each board's
+        # jobs as soon as it has been parsed
+        print(f"\n📊 Scraping {len(self.scrapers)} job board(s) in parallel...")
+        new_counts = {}
+        events = self.engine.stream(
+            keywords=self.keywords,
+            locations=self.locations,
+            max_jobs=self.max_jobs
+        )
+        
+        try:
+            for event in events:
+                if not event.finished:
+                    # Add new jobs to database (committed per board)
+                    new_jobs = self.db.add_jobs(event.jobs)
+                    new_counts[event.name] = new_counts.get(event.name, 0) + len(new_jobs)
+                    # Only now may the board be skipped as unchanged next time
+                    if event.commit is not None:
+                        event.commit()
+                    continue
                 
-                # Add new jobs to database
-                new_jobs_count = 0
-                for job in jobs:
-                    if self.db.add_job(job):
-                        all_new_jobs.append(job)
-                        new_jobs_count += 1
+                if event.error is not None:
+                    print(f"✗ Error scraping {event.name}: {str(event.error)}")
+                    continue
                 
+                print(f"\n✓ Found {event.total} job(s) from {event.name}")
+                new_jobs_count = new_counts.get(event.name, 0)
                 if new_jobs_count > 0:
                     print(f"✓ {new_jobs_count} new job(s) added to database")
                 else:
                     print("  No new jobs found")
-                
-            except Exception as e:
-                print(f"✗ Error scraping {scraper_name}: {str(e)}")
-                continue
-        
-        # Send email notification if there are new jobs
-        if all_new_jobs:
-            print(f"\n📧 Sending email notification for {len(all_new_jobs)} new job(s)...")
-            success = self.notifier.send_job_alert(all_new_jobs)
-            
-            if success:
-                # Mark jobs as notified
-                for job in all_new_jobs:
-                    self.db.mark_as_notified(job['job_id'])
-                print("✓ Email sent and jobs marked as notified")
-            else:
-                print("✗ Failed to send email notification")
-        else:
+        finally:
+            # Stops the scrapers if storing a batch failed
+            events.close()
+        
+        self.fingerprints.save()
+        boards = self.fingerprints.cycle_stats()
+        print(f"\n🔁 {boards['boards_changed']} of {boards['boards_checked']} board(s) changed since last check")
+        
+        # Workers only update the tracker in memory; persist it from this thread
+        self.db.save_board_health(self.board_health.pop_dirty())
+        health = self.board_health.cycle_stats()
+        if health['boards_failed'] or health['boards_skipped']:
+            print(f"🩺 {health['boards_failed']} board(s) failed, {health['boards_skipped']} backed-off board(s) skipped, "
+                  f"{self.board_health.backed_off()} backed off in total")
+        
+        # Email the jobs waiting in the outbox: this cycle's new jobs and any
+        # left over from a failed send or an earlier run (priority companies
+        # only, while a digest is still accumulating). With background
+        # delivery this only queues the emails; jobs are marked as notified
+        # once theirs has actually been sent
+        if not self.outbox.drain() and not self.outbox.waiting:
             print("\n  No new jobs to notify")
         
         # Print statistics
@@ -111,6 +209,8 @@ class JobAlertSystem:
     def run_once(self):
         """Run the job check once and exit."""
         self.check_for_jobs()
+        # Wait for the alert email before exiting
+        self.notifier.close()
     
     def run_scheduled(self, interval_minutes: int = None):
         """Run the job check on a schedule."""
@@ -122,18 +222,24 @@ class JobAlertSystem:
         print(f"📧 Email notifications will be sent to: {EMAIL_CONFIG['recipient_email']}")
         print(f"\nPress Ctrl+C to stop\n")
         
-        # Run immediately on start
-        self.check_for_jobs()
-        
-        # Schedule periodic checks
-        schedule.every(interval_minutes).minutes.do(self.check_for_jobs)
+        # Run immediately on start, then every interval; a check that is still
+        # running when the next one is due is skipped (or coalesced)
+        deadline_minutes = SCRAPING_CONFIG.get('check_deadline_minutes') or interval_minutes
+        self.scheduler.add(
+            'check_for_jobs',
+            self.check_for_jobs,
+            interval_minutes * 60,
+            deadline=deadline_minutes * 60,
+            overlap=SCRAPING_CONFIG.get('check_overlap', 'skip')
+        )
         
-        # Keep running
+        # Sleeps until the next task is due
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            self.scheduler.run()
         except KeyboardInterrupt:
+            self.scheduler.stop()
+            if not self.notifier.close(timeout=30):
+                print("⚠️  Some alert emails were not delivered before shutdown")
             print("\n\n👋 Job Alert System stopped by user")
             sys.exit(0)
     
@@ -173,8 +279,51 @@ def main():
             print(f"Jobs notified: {stats['notified_jobs']}")
             print(f"Pending notifications: {stats['pending_notifications']}")
             print(f"Number of sources: {stats['sources']}")
+            for source in system.db.get_source_stats()[:10]:
+                print(f"   {source['source']}: {source['total_jobs']} job(s), "
+                      f"{source['pending_notifications']} pending")
+            seen = stats['seen_index']
+            print(f"Seen-job index: {seen['entries']} entries, {seen['memory_bytes'] / 1024:.1f} KiB, "
+                  f"~{seen['false_positive_rate']:.4%} false positives"
+                  f"{'' if seen['loaded'] else ' (built on the first check)'}")
+            failing = system.db.get_failing_boards()
+            if failing:
+                print("Failing boards:")
+                for board in failing:
+                    print(f"   {board['board_key']}: {board['consecutive_failures']} failure(s) in a row, "
+                          f"last status {board['last_status'] or 'error'}")
+            print()
+        
+        elif command == 'subscribers':
+            # List subscriptions
+            subscriptions = system.db.get_subscriptions()
+            print(f"\n📬 {len(subscriptions)} subscriber(s)")
+            for entry in subscriptions:
+                print(f"   {entry['email']}: keywords {', '.join(entry['keywords']) or 'any'}; "
+                      f"locations {', '.join(entry['locations']) or 'any'}; "
+                      f"companies {', '.join(entry['companies']) or 'any'}")
             print()
         
+        elif command == 'subscribe' and len(sys.argv) > 2:
+            # Add or update a subscription: email, then comma-separated keywords, locations, companies
+            def terms(position):
+                value = sys.argv[position] if len(sys.argv) > position else ''
+                return [term.strip() for term in value.split(',') if term.strip()]
+            
+            system.db.save_subscriptions([{
+                'email': sys.argv[2],
+                'keywords': terms(3),
+                'locations': terms(4),
+                'companies': terms(5),
+            }])
+            print(f"✓ Subscribed {sys.argv[2]}")
+        
+        elif command == 'unsubscribe' and len(sys.argv) > 2:
+            if system.db.delete_subscription(sys.argv[2]):
+                print(f"✓ Unsubscribed {sys.argv[2]}")
+            else:
+                print(f"No subscription for {sys.argv[2]}")
+        
         else:
             print(f"Unknown command: {command}")
             print("\nUsage:")
@@ -182,6 +331,9 @@ def main():
             print("  python main.py test     - Send a test email")
             print("  python main.py once     - Run once and exit")
             print("  python main.py stats    - Show database statistics")
+            print("  python main.py subscribers - List subscribers")
+            print('  python main.py subscribe EMAIL "keywords" ["locations"] ["companies"] - Add or update a subscriber')
+            print("  python main.py unsubscribe EMAIL - Remove a subscriber")
     
     else:
         # Run scheduled checks
@@ -0,0 +1,107 @@
+"""
+Precompiled title/location filters shared by all scrapers.
+Keyword and location lists are folded into a trie and compiled into one
+regular expression each, so a posting is checked with a single scan no
+matter how many keywords or locations are configured.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# Lever postings pass the "United States" filter if their location mentions
+# one of these (case-sensitive, so 'US' does not match 'Australia')
+US_LOCATION_TERMS = [
+    'United States', 'US', 'Remote',
+    'New York', 'San Francisco', 'Seattle', 'Boston', 'Austin', 'Chicago', 'Los Angeles',
+]
+
+
+def _trie_pattern(trie: Dict) -> str:
+    """Regex for every word stored in a character trie ('' marks a word end)."""
+    if '' in trie:
+        # For substring search a word ending here already matches; longer ones add nothing
+        return ''
+    
+    branches = []
+    singles = []
+    for char in sorted(key for key in trie if key):
+        sub = _trie_pattern(trie[char])
+        if sub:
+            branches.append(re.escape(char) + sub)
+        else:
+            singles.append(re.escape(char))
+    
+    if singles:
+        branches.append(singles[0] if len(singles) == 1 else f"[{''.join(singles)}]")
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+def compile_terms(terms: Iterable[str], ignore_case: bool = True) -> Optional['re.Pattern']:
+    """
+    Compile substring terms into one trie-shaped regex, or None if there are none.
+    With ignore_case, terms are lowercased and the text must be lowercased too.
+    """
+    trie: Dict = {}
+    for term in terms:
+        term = term.lower() if ignore_case else term
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    
+    if not trie:
+        return None
+    return re.compile(_trie_pattern(trie))
+
+
+class JobMatcher:
+    """
+    Internship / keyword / location filters for one set of search settings.
+    Matching is case-insensitive and equivalent to `term.lower() in text.lower()`
+    for any configured term; an empty keyword or location list matches everything.
+    """
+    
+    INTERN = compile_terms(['intern'])
+    INTERN_BYTES = re.compile(rb'intern', re.IGNORECASE)
+    US_LOCATIONS = compile_terms(US_LOCATION_TERMS, ignore_case=False)
+    
+    def __init__(self, keywords: List[str], locations: List[str]):
+        self.keywords = list(keywords or [])
+        self.locations = list(locations or [])
+        self.keyword_pattern = compile_terms(self.keywords)
+        self.location_pattern = compile_terms(self.locations)
+        # Lever only knows free-form locations, so it applies a US check instead
+        self.us_only = 'United States' in self.locations
+    
+    def is_internship(self, title: str) -> bool:
+        return self.INTERN.search(title.lower()) is not None
+    
+    def may_contain_internship(self, content: bytes) -> bool:
+        """False if a raw response cannot contain an internship title (no 'intern' anywhere)."""
+        return self.INTERN_BYTES.search(content) is not None
+    
+    def matches_keywords(self, title: str) -> bool:
+        if self.keyword_pattern is None:
+            return True
+        return self.keyword_pattern.search(title.lower()) is not None
+    
+    def matches_location(self, location: str) -> bool:
+        if self.location_pattern is None:
+            return True
+        return self.location_pattern.search(location.lower()) is not None
+    
+    def matches_us_location(self, location: str) -> bool:
+        """True unless the search is US-only and `location` is not recognisably US."""
+        if not self.us_only:
+            return True
+        return self.US_LOCATIONS.search(location) is not None
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords: tuple, locations: tuple) -> JobMatcher:
+    return JobMatcher(list(keywords), list(locations))
+
+
+def get_matcher(keywords: List[str], locations: List[str]) -> JobMatcher:
+    """Shared JobMatcher for these search settings (compiled once per settings)."""
+    return _cached_matcher(tuple(keywords or ()), tuple(locations or ()))
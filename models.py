@@ -0,0 +1,83 @@
+"""
+Compact job record shared by the scrapers, the database and the notifier.
+"""
+import sys
+from typing import Dict, Iterator, Tuple, Union
+
+
+class Job:
+    """
+    One job posting.
+    Uses __slots__ instead of a per-instance dict, and interns `company` and
+    `source`, which repeat across thousands of postings. Also supports the
+    dict-style access (job['title'], job.get('location')) older callers use.
+    """
+    
+    __slots__ = ('job_id', 'title', 'company', 'location', 'url', 'source', 'description', 'posted_date')
+    
+    def __init__(self, job_id: str, title: str, company: str, location: str = '', url: str = '',
+                 source: str = '', description: str = '', posted_date: str = ''):
+        self.job_id = job_id
+        self.title = title
+        self.company = sys.intern(company)
+        self.location = location
+        self.url = url
+        self.source = sys.intern(source)
+        self.description = description
+        self.posted_date = posted_date
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        """Build a Job from a job dictionary or database row; unknown keys are ignored."""
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data and data[field] is not None})
+    
+    @classmethod
+    def coerce(cls, job: Union['Job', Dict]) -> 'Job':
+        return job if isinstance(job, cls) else cls.from_dict(job)
+    
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    # Pickled as a plain tuple (smaller, for the parse process pool); strings
+    # are re-interned on load
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __setstate__(self, state: Tuple):
+        for field, value in zip(self.__slots__, state):
+            setattr(self, field, value)
+        self.company = sys.intern(self.company)
+        self.source = sys.intern(self.source)
+    
+    # dict compatibility
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+    
+    def items(self) -> Iterator[Tuple[str, object]]:
+        return ((field, getattr(self, field)) for field in self.__slots__)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Job):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Job({self.job_id!r}, {self.title!r}, {self.company!r}, source={self.source!r})"
@@ -0,0 +1,237 @@
+"""
+Durable notification outbox.
+The jobs table is the outbox: new jobs are stored with notified = 0, and
+each check drains them in row-id order, one email per batch. A batch is
+marked as notified in one transaction only after its email has been sent,
+so jobs stored before a crash or a failed send are emailed by a later drain
+instead of being lost.
+
+With a digest window, pending jobs are held back and sent together once the
+oldest has waited `digest_window_minutes` or `digest_max_jobs` are pending;
+jobs from priority companies are sent right away.
+
+With several recipients, each one's progress is recorded per job (the
+deliveries table): a job is marked as notified once every recipient has it,
+and a partly failed alert is retried only for the recipients that missed it.
+
+With a SubscriptionIndex, each batch is split into one digest per matching
+subscriber, tracked the same way: a subscriber whose digest failed is sent
+only the jobs it is missing, and one the mail server refuses for good is
+not retried.
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from company_registry import company_key
+from models import Job
+from smtp_delivery import DeliveryResult
+
+
+class NotificationOutbox:
+    """
+    Hands pending jobs from a JobDatabase to an EmailNotifier in batches.
+    Rows already handed over are remembered by id until their email is sent,
+    so a batch that is still queued for background delivery is not sent
+    twice; a failed batch is released and retried by the next drain(), for
+    the recipients that did not get it.
+    """
+    
+    def __init__(self, db, notifier, batch_size: int = 100, max_batches: int = 10,
+                 digest_window_minutes: float = 0, digest_max_jobs: Optional[int] = None,
+                 priority_companies: Iterable[str] = (), subscriptions=None):
+        self.db = db
+        self.notifier = notifier
+        # Optional SubscriptionIndex; without one every job goes to the notifier's recipients
+        self.subscriptions = subscriptions
+        self.batch_size = max(1, batch_size)
+        # Emails per drain; a large backlog is spread over several checks
+        self.max_batches = max(1, max_batches)
+        # 0 sends pending jobs on every drain
+        self.digest_window = digest_window_minutes * 60
+        # Sends a digest before its window has elapsed (ignored without a window)
+        self.digest_max_jobs = digest_max_jobs
+        self.priority = {company_key(company) for company in priority_companies if company}
+        self.lock = threading.Lock()
+        # Row ids handed to the notifier whose email has not been confirmed yet
+        self.in_flight: Set[int] = set()
+        # Pending jobs held back for the digest after the last drain
+        self.waiting = 0
+    
+    def is_urgent(self, job: Dict) -> bool:
+        """True for jobs from a priority company (by board slug or company name)."""
+        if not self.priority:
+            return False
+        source = job.get('source') or ''
+        if '-' in source and company_key(source.split('-', 1)[1]) in self.priority:
+            return True
+        company = (job.get('company') or '').strip().lower().replace(' ', '-')
+        return company_key(company) in self.priority
+    
+    def digest_due(self, now: datetime = None) -> bool:
+        """
+        True if held-back jobs should be sent now: always without a digest
+        window, otherwise once the window has elapsed or enough are pending.
+        """
+        if not self.digest_window:
+            return True
+        summary = self.db.get_outbox_summary()
+        if not summary['pending']:
+            return False
+        if self.digest_max_jobs and summary['pending'] >= self.digest_max_jobs:
+            return True
+        now = now or datetime.now()
+        oldest = datetime.fromisoformat(summary['oldest_created_at'])
+        return (now - oldest).total_seconds() >= self.digest_window
+    
+    def _pending(self) -> Iterator[Dict]:
+        """Pending rows not already handed to the notifier, oldest first."""
+        after_id = 0
+        while True:
+            rows = self.db.get_outbox_batch(after_id, self.batch_size)
+            if not rows:
+                return
+            after_id = rows[-1]['id']
+            with self.lock:
+                in_flight = set(self.in_flight)
+            for row in rows:
+                if row['id'] not in in_flight:
+                    yield row
+    
+    def drain(self, now: datetime = None) -> int:
+        """
+        Email pending jobs, oldest first: all of them if the digest is due,
+        otherwise only urgent ones. Returns the number of jobs handed to the notifier.
+        """
+        due = self.digest_due(now)
+        handed = 0
+        batches = 0
+        waiting = 0
+        batch = []
+        
+        for row in self._pending():
+            if not due and not self.is_urgent(row):
+                waiting += 1
+                continue
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                if not self._send(batch, urgent=not due):
+                    batch = []
+                    break
+                handed += len(batch)
+                batch = []
+                batches += 1
+                if batches >= self.max_batches:
+                    break
+        
+        if batch and self._send(batch, urgent=not due):
+            handed += len(batch)
+        
+        self.waiting = waiting
+        if waiting:
+            print(f"\n🕒 {waiting} job(s) held for the next digest")
+        return handed
+    
+    def _send(self, rows: List[Dict], urgent: bool = False) -> bool:
+        ids = [row['id'] for row in rows]
+        with self.lock:
+            self.in_flight.update(ids)
+        
+        label = "priority job(s)" if urgent else "job(s)"
+        print(f"\n📧 Sending email notification for {len(rows)} {label}...")
+        jobs = [Job.from_dict(row) for row in rows]
+        if self.subscriptions is not None:
+            success = self._send_to_subscribers(rows, jobs)
+        elif not self.notifier.recipients:
+            print("✗ No recipient_email configured")
+            self._release(ids)
+            success = False
+        else:
+            success = self._deliver(rows, {email: jobs for email in self.notifier.recipients})
+        if not success:
+            print("✗ Failed to send email notification")
+        return success
+    
+    def _deliver(self, rows: List[Dict], routed: Dict[str, List[Job]]) -> bool:
+        """
+        Send each recipient the routed jobs it has not received yet; recipients
+        with the same jobs outstanding share one alert. Once every alert is
+        done with, rows that reached all their recipients (or were refused by
+        them for good) are marked as notified and the rest are released, to be
+        retried for the recipients still missing them.
+        """
+        ids = [row['id'] for row in rows]
+        row_ids = {row['job_id']: row['id'] for row in rows}
+        settled = self.db.get_deliveries(ids)
+        needed: Dict[int, Set[str]] = {row_id: set() for row_id in ids}
+        alerts: Dict[Tuple[int, ...], Tuple[List[Job], List[str]]] = {}
+        for email, jobs in routed.items():
+            outstanding = []
+            for job in jobs:
+                row_id = row_ids[job.job_id]
+                needed[row_id].add(email.lower())
+                if email.lower() not in settled.get(row_id, ()):
+                    outstanding.append(job)
+            if outstanding:
+                key = tuple(row_ids[job.job_id] for job in outstanding)
+                alerts.setdefault(key, (outstanding, []))[1].append(email)
+        
+        if not alerts:
+            self._sent(ids)
+            return True
+        
+        lock = threading.Lock()
+        pending = set(alerts)
+        
+        def done(key: Tuple[int, ...], result: DeliveryResult):
+            reached = result.delivered + result.refused
+            self.db.record_deliveries(list(key), reached)
+            with lock:
+                if key not in pending:
+                    return
+                pending.discard(key)
+                for row_id in key:
+                    settled.setdefault(row_id, set()).update(email.lower() for email in reached)
+                last = not pending
+            if last:
+                self._settle(ids, needed, settled)
+        
+        success = True
+        for key, (jobs, emails) in alerts.items():
+            callback = lambda result, key=key: done(key, result)
+            if not self.notifier.send_job_alert(jobs, on_sent=callback, on_failed=callback, recipients=emails):
+                done(key, DeliveryResult([], [], emails))
+                success = False
+        return success
+    
+    def _settle(self, ids: List[int], needed: Dict[int, Set[str]], settled: Dict[int, Set[str]]):
+        """Mark the rows every recipient has as notified; release the rest for a retry."""
+        complete = [row_id for row_id in ids if needed[row_id] <= settled.get(row_id, set())]
+        retry = [row_id for row_id in ids if not needed[row_id] <= settled.get(row_id, set())]
+        if complete:
+            self._sent(complete)
+        if retry:
+            self._release(retry)
+            print(f"⚠️  {len(retry)} job(s) will be retried for the recipient(s) that did not get them")
+    
+    def _send_to_subscribers(self, rows: List[Dict], jobs: List[Job]) -> bool:
+        """One digest per subscriber with matches (see _deliver)."""
+        routed = self.subscriptions.route(jobs)
+        if not routed:
+            print("  No subscriber matches these jobs")
+        else:
+            print(f"   {len(routed)} subscriber(s) matched")
+        return self._deliver(rows, routed)
+    
+    def _sent(self, ids: List[int]):
+        marked = self.db.mark_outbox_sent(ids)
+        self._release(ids)
+        if marked == len(ids):
+            print("✓ Email sent and jobs marked as notified")
+        else:
+            print(f"⚠️  Email sent but only {marked}/{len(ids)} job(s) were marked as notified")
+    
+    def _release(self, ids: List[int]):
+        """Forget handed-over rows (sent, or eligible for the next drain again)."""
+        with self.lock:
+            self.in_flight.difference_update(ids)
@@ -0,0 +1,68 @@
+"""
+Process pool for the CPU-bound HTML parsing stage.
+Fetch threads hand raw response bytes to parser processes and get Job
+records back, so parsing Indeed/LinkedIn/Ashby pages uses every core
+instead of contending for the GIL with the fetchers.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from models import Job
+
+# Per-process settings and scraper instances (set by _init_worker)
+_settings: Dict = {}
+_scrapers: Dict = {}
+
+
+def _init_worker(html_parser: str, companies_file: str):
+    _settings['html_parser'] = html_parser
+    _settings['companies_file'] = companies_file
+
+
+def _parse_board(scraper_class: str, board, content: bytes, keywords: List[str],
+                 locations: List[str], max_jobs: int) -> List[Job]:
+    """Runs in a worker process: parse one board with a process-local scraper."""
+    scraper = _scrapers.get(scraper_class)
+    if scraper is None:
+        # Imported here so the parent can import this module from scrapers.py
+        import scrapers
+        from company_registry import get_registry
+        from parsers import get_parser
+        
+        scraper = getattr(scrapers, scraper_class)(
+            '',
+            html_parser=get_parser(_settings.get('html_parser', 'auto')),
+            registry=get_registry(_settings.get('companies_file'))
+        )
+        _scrapers[scraper_class] = scraper
+    return scraper.parse_board(board, content, keywords, locations, max_jobs)
+
+
+class ParsePool:
+    """
+    A pool of `workers` parser processes shared by all scrapers.
+    Workers are started with 'spawn', so they never inherit the fetch
+    threads' locks or sockets.
+    """
+    
+    def __init__(self, workers: int, html_parser: str = 'auto', companies_file: str = None):
+        self.workers = max(1, workers)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(html_parser, companies_file)
+        )
+    
+    def parse(self, scraper, board, content: bytes, keywords: List[str],
+              locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse a board in a worker process; blocks the calling fetch thread only."""
+        future = self.executor.submit(
+            _parse_board, scraper.__class__.__name__, board, content,
+            list(keywords or []), list(locations or []), max_jobs
+        )
+        return future.result()
+    
+    def close(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,330 @@
+"""
+HTML parsing backends for the Indeed, LinkedIn and Ashby scrapers.
+Each backend turns a results page into plain "card" dictionaries
+(title, company, location, href) using selectors compiled once at import
+time; the scrapers then apply their filters and build Job records.
+
+Backends, fastest first: 'selectolax' (optional), 'lxml', 'bs4' (fallback).
+"""
+from typing import List, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+def _class_token(name: str) -> str:
+    """XPath predicate: element has `name` as one of its CSS classes."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _class_contains(text: str) -> str:
+    """XPath predicate: some CSS class contains `text`, case-insensitively."""
+    return f"contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text}')"
+
+
+class HTMLParserBackend:
+    """Interface shared by all parser backends."""
+    
+    name = 'base'
+    
+    def indeed_cards(self, content: bytes, limit: int) -> List[Dict]:
+        raise NotImplementedError
+    
+    def linkedin_cards(self, content: bytes, limit: int) -> List[Dict]:
+        raise NotImplementedError
+    
+    def ashby_cards(self, content: bytes, limit: int) -> List[Dict]:
+        raise NotImplementedError
+
+
+class BeautifulSoupBackend(HTMLParserBackend):
+    """Pure-Python fallback; slow on large pages but always available."""
+    
+    name = 'bs4'
+    
+    def indeed_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        for card in soup.find_all('div', class_='job_seen_beacon')[:limit]:
+            title_elem = card.find('h2', class_='jobTitle')
+            if not title_elem:
+                continue
+            company_elem = card.find('span', {'data-testid': 'company-name'})
+            location_elem = card.find('div', {'data-testid': 'text-location'})
+            link = title_elem.find('a')
+            cards.append({
+                'title': title_elem.get_text(strip=True),
+                'company': company_elem.get_text(strip=True) if company_elem else None,
+                'location': location_elem.get_text(strip=True) if location_elem else None,
+                'href': link.get('href') if link else None,
+            })
+        
+        return cards
+    
+    def linkedin_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        for card in soup.find_all('li')[:limit]:
+            base_card = card.find('div', class_='base-card')
+            if not base_card:
+                continue
+            title_elem = base_card.find('h3', class_='base-search-card__title')
+            link_elem = base_card.find('a', class_='base-card__full-link')
+            if not title_elem or not link_elem:
+                continue
+            company_elem = base_card.find('h4', class_='base-search-card__subtitle')
+            location_elem = base_card.find('span', class_='job-search-card__location')
+            cards.append({
+                'title': title_elem.get_text(strip=True),
+                'company': company_elem.get_text(strip=True) if company_elem else None,
+                'location': location_elem.get_text(strip=True) if location_elem else None,
+                'href': link_elem.get('href', ''),
+            })
+        
+        return cards
+    
+    def ashby_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Look for job listings - Ashby structure varies
+        job_cards = soup.find_all(['div', 'a'], class_=lambda x: x and ('job' in x.lower() or 'posting' in x.lower()))
+        
+        for card in job_cards[:limit]:
+            title_elem = card.find(['h3', 'h2', 'span'], class_=lambda x: x and 'title' in x.lower())
+            if not title_elem:
+                title_elem = card.find('a')
+            if not title_elem:
+                continue
+            link = card.find('a') or card
+            location_elem = card.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
+            cards.append({
+                'title': title_elem.get_text(strip=True),
+                'company': None,
+                'location': location_elem.get_text(strip=True) if location_elem else None,
+                'href': link.get('href', '') if link.name == 'a' else '',
+            })
+        
+        return cards
+
+
+class LxmlBackend(HTMLParserBackend):
+    """libxml2 tree with precompiled XPath expressions."""
+    
+    name = 'lxml'
+    
+    if etree is not None:
+        INDEED_CARDS = etree.XPath(f"//div[{_class_token('job_seen_beacon')}]")
+        INDEED_TITLE = etree.XPath(f".//h2[{_class_token('jobTitle')}]")
+        INDEED_COMPANY = etree.XPath(".//span[@data-testid='company-name']")
+        INDEED_LOCATION = etree.XPath(".//div[@data-testid='text-location']")
+        
+        LINKEDIN_CARDS = etree.XPath("//li")
+        LINKEDIN_BASE = etree.XPath(f".//div[{_class_token('base-card')}]")
+        LINKEDIN_TITLE = etree.XPath(f".//h3[{_class_token('base-search-card__title')}]")
+        LINKEDIN_COMPANY = etree.XPath(f".//h4[{_class_token('base-search-card__subtitle')}]")
+        LINKEDIN_LOCATION = etree.XPath(f".//span[{_class_token('job-search-card__location')}]")
+        LINKEDIN_LINK = etree.XPath(f".//a[{_class_token('base-card__full-link')}]")
+        
+        ASHBY_CARDS = etree.XPath(
+            f"//*[(self::div or self::a) and ({_class_contains('job')} or {_class_contains('posting')})]"
+        )
+        ASHBY_TITLE = etree.XPath(f".//*[(self::h3 or self::h2 or self::span) and {_class_contains('title')}]")
+        ASHBY_LOCATION = etree.XPath(f".//*[(self::span or self::div) and {_class_contains('location')}]")
+        ANY_LINK = etree.XPath(".//a")
+    
+    @staticmethod
+    def _tree(content: bytes):
+        if not content or not content.strip():
+            return None
+        return lxml_html.fromstring(content)
+    
+    @staticmethod
+    def _first(xpath, node):
+        found = xpath(node)
+        return found[0] if found else None
+    
+    @staticmethod
+    def _text(node) -> Optional[str]:
+        if node is None:
+            return None
+        return ''.join(part.strip() for part in node.itertext())
+    
+    def indeed_cards(self, content: bytes, limit: int) -> List[Dict]:
+        tree = self._tree(content)
+        if tree is None:
+            return []
+        
+        cards = []
+        for card in self.INDEED_CARDS(tree)[:limit]:
+            title_elem = self._first(self.INDEED_TITLE, card)
+            if title_elem is None:
+                continue
+            link = self._first(self.ANY_LINK, title_elem)
+            cards.append({
+                'title': self._text(title_elem),
+                'company': self._text(self._first(self.INDEED_COMPANY, card)),
+                'location': self._text(self._first(self.INDEED_LOCATION, card)),
+                'href': link.get('href') if link is not None else None,
+            })
+        return cards
+    
+    def linkedin_cards(self, content: bytes, limit: int) -> List[Dict]:
+        tree = self._tree(content)
+        if tree is None:
+            return []
+        
+        cards = []
+        for card in self.LINKEDIN_CARDS(tree)[:limit]:
+            base_card = self._first(self.LINKEDIN_BASE, card)
+            if base_card is None:
+                continue
+            title_elem = self._first(self.LINKEDIN_TITLE, base_card)
+            link_elem = self._first(self.LINKEDIN_LINK, base_card)
+            if title_elem is None or link_elem is None:
+                continue
+            cards.append({
+                'title': self._text(title_elem),
+                'company': self._text(self._first(self.LINKEDIN_COMPANY, base_card)),
+                'location': self._text(self._first(self.LINKEDIN_LOCATION, base_card)),
+                'href': link_elem.get('href', ''),
+            })
+        return cards
+    
+    def ashby_cards(self, content: bytes, limit: int) -> List[Dict]:
+        tree = self._tree(content)
+        if tree is None:
+            return []
+        
+        cards = []
+        for card in self.ASHBY_CARDS(tree)[:limit]:
+            link = self._first(self.ANY_LINK, card)
+            title_elem = self._first(self.ASHBY_TITLE, card)
+            if title_elem is None:
+                title_elem = link
+            if title_elem is None:
+                continue
+            if link is None:
+                link = card
+            cards.append({
+                'title': self._text(title_elem),
+                'company': None,
+                'location': self._text(self._first(self.ASHBY_LOCATION, card)),
+                'href': link.get('href', '') if link.tag == 'a' else '',
+            })
+        return cards
+
+
+class SelectolaxBackend(HTMLParserBackend):
+    """Lexbor (C) parser with CSS selectors; requires the optional selectolax package."""
+    
+    name = 'selectolax'
+    
+    @staticmethod
+    def _text(node) -> Optional[str]:
+        if node is None:
+            return None
+        return node.text(deep=True, separator='', strip=True)
+    
+    def indeed_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        tree = LexborHTMLParser(content)
+        
+        for card in tree.css('div.job_seen_beacon')[:limit]:
+            title_elem = card.css_first('h2.jobTitle')
+            if title_elem is None:
+                continue
+            link = title_elem.css_first('a')
+            cards.append({
+                'title': self._text(title_elem),
+                'company': self._text(card.css_first('span[data-testid="company-name"]')),
+                'location': self._text(card.css_first('div[data-testid="text-location"]')),
+                'href': link.attributes.get('href') if link is not None else None,
+            })
+        return cards
+    
+    def linkedin_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        tree = LexborHTMLParser(content)
+        
+        for card in tree.css('li')[:limit]:
+            base_card = card.css_first('div.base-card')
+            if base_card is None:
+                continue
+            title_elem = base_card.css_first('h3.base-search-card__title')
+            link_elem = base_card.css_first('a.base-card__full-link')
+            if title_elem is None or link_elem is None:
+                continue
+            cards.append({
+                'title': self._text(title_elem),
+                'company': self._text(base_card.css_first('h4.base-search-card__subtitle')),
+                'location': self._text(base_card.css_first('span.job-search-card__location')),
+                'href': link_elem.attributes.get('href') or '',
+            })
+        return cards
+    
+    def ashby_cards(self, content: bytes, limit: int) -> List[Dict]:
+        cards = []
+        tree = LexborHTMLParser(content)
+        
+        selector = ':is(div, a):is([class*="job" i], [class*="posting" i])'
+        for card in tree.css(selector)[:limit]:
+            link = card.css_first('a')
+            title_elem = card.css_first(':is(h3, h2, span)[class*="title" i]')
+            if title_elem is None:
+                title_elem = link
+            if title_elem is None:
+                continue
+            if link is None:
+                link = card
+            cards.append({
+                'title': self._text(title_elem),
+                'company': None,
+                'location': self._text(card.css_first(':is(span, div)[class*="location" i]')),
+                'href': (link.attributes.get('href') or '') if link.tag == 'a' else '',
+            })
+        return cards
+
+
+BACKENDS = {
+    'selectolax': SelectolaxBackend,
+    'lxml': LxmlBackend,
+    'bs4': BeautifulSoupBackend,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the backends whose libraries are installed, fastest first."""
+    names = []
+    if LexborHTMLParser is not None:
+        names.append('selectolax')
+    if etree is not None:
+        names.append('lxml')
+    names.append('bs4')
+    return names
+
+
+def get_parser(name: str = 'auto') -> HTMLParserBackend:
+    """
+    Return a parser backend by name. 'auto' picks the fastest installed one;
+    an unavailable backend falls back to BeautifulSoup.
+    """
+    available = available_backends()
+    if name == 'auto':
+        name = available[0]
+    if name not in available:
+        print(f"⚠️  Warning: HTML parser '{name}' is not available. Using BeautifulSoup.")
+        name = 'bs4'
+    return BACKENDS[name]()
@@ -0,0 +1,96 @@
+"""
+Adaptive per-board polling.
+Each board's rate of new postings is estimated from the jobs table; every
+cycle the request budget goes to the boards with the most expected new
+postings since they were last polled. Busy boards are polled every cycle,
+quiet ones only occasionally, and no board waits longer than a maximum
+interval.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+# Every board is assumed to have had this many new jobs in the window, so
+# boards without history still get polled now and then
+PRIOR_JOBS = 1.0
+
+
+class PollPlanner:
+    """
+    Chooses which boards to poll in a cycle.
+    plan() is called once per cycle from the main thread; scraper workers
+    then ask is_due() for each board.
+    """
+    
+    def __init__(self, max_requests: Optional[int] = None, max_interval_hours: float = 24,
+                 window_days: int = 30, health=None, entries: List[Dict] = None):
+        # None means no budget: every board is polled every cycle
+        self.max_requests = max_requests
+        self.max_interval = max_interval_hours * 3600
+        self.window_days = window_days
+        # Optional BoardHealthTracker; backed-off boards do not use up the budget
+        self.health = health
+        self.lock = threading.Lock()
+        # board key -> Unix time it was last polled
+        self.last_polled: Dict[str, float] = {
+            entry['board_key']: entry['last_checked_at']
+            for entry in entries or [] if entry.get('last_checked_at')
+        }
+        self.due = None
+    
+    def rate(self, key: str, churn: Dict[str, int], shared: Dict[str, int]) -> float:
+        """
+        Estimated new jobs per day for a board. Boards whose jobs are stored
+        under the scraper's name (Indeed/LinkedIn searches) share that count.
+        """
+        if key in churn:
+            new_jobs = churn[key]
+        else:
+            source = key.split('-', 1)[0]
+            new_jobs = churn.get(source, 0) / max(1, shared.get(source, 1))
+        return (new_jobs + PRIOR_JOBS) / self.window_days
+    
+    def plan(self, board_keys: Iterable[str], churn: Dict[str, int], now: float = None) -> List[str]:
+        """
+        Select this cycle's boards from `board_keys` given new jobs per
+        source over the window (JobDatabase.get_source_churn). Returns the
+        selected keys, most valuable first.
+        """
+        now = time.time() if now is None else now
+        keys = list(dict.fromkeys(board_keys))
+        if self.health is not None:
+            keys = [key for key in keys if not self.health.is_backed_off(key, now)]
+        
+        if self.max_requests is None or len(keys) <= self.max_requests:
+            due = keys
+        else:
+            shared = {}
+            for key in keys:
+                if key not in churn:
+                    source = key.split('-', 1)[0]
+                    shared[source] = shared.get(source, 0) + 1
+            
+            def priority(key):
+                last = self.last_polled.get(key)
+                if last is None:
+                    # Never polled: first, in board order
+                    return (2, 0.0)
+                waited = now - last
+                if waited >= self.max_interval:
+                    # Overdue: most overdue first
+                    return (1, waited)
+                # Expected new postings since the last poll
+                return (0, self.rate(key, churn, shared) * waited / 86400)
+            
+            due = sorted(keys, key=priority, reverse=True)[:max(0, self.max_requests)]
+        
+        with self.lock:
+            self.due = set(due)
+            for key in due:
+                self.last_polled[key] = now
+        return due
+    
+    def is_due(self, key: str) -> bool:
+        """True if the board was selected this cycle (or no plan was made)."""
+        with self.lock:
+            return self.due is None or key in self.due
@@ -0,0 +1,82 @@
+"""
+Per-host rate limiting for scrapers.
+Each host gets its own token bucket, so requests to one host never wait on
+the budget of an unrelated host.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# Requests per second and burst size per host. Hosts not listed use 'default'.
+DEFAULT_RATE_LIMITS = {
+    'default': {'rate': 2.0, 'burst': 2},
+    'www.indeed.com': {'rate': 0.5, 'burst': 1},
+    'www.linkedin.com': {'rate': 1.0, 'burst': 1},
+    'jobs.ashbyhq.com': {'rate': 1.0, 'burst': 2},
+    'boards-api.greenhouse.io': {'rate': 2.0, 'burst': 4},
+    'api.lever.co': {'rate': 2.0, 'burst': 4},
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second (must be > 0)."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        if not rate or rate <= 0:
+            # A zero rate would otherwise disable throttling for the host
+            raise ValueError(f"rate must be a positive number of requests per second, got {rate!r}")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take one token and return how many seconds the caller must wait
+        before using it (0 if a token was available).
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """Shared registry of token buckets keyed by host name."""
+    
+    def __init__(self, limits: Optional[Dict[str, Dict]] = None):
+        self.limits = dict(DEFAULT_RATE_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        # Fail at startup rather than on the first request to a misconfigured host
+        for host, limit in self.limits.items():
+            if not limit.get('rate') or limit['rate'] <= 0:
+                raise ValueError(f"rate_limits['{host}']: rate must be a positive number of requests per second")
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+    
+    def _bucket(self, host: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                limit = self.limits.get(host, self.limits['default'])
+                bucket = TokenBucket(limit['rate'], limit.get('burst', 1))
+                self.buckets[host] = bucket
+            return bucket
+    
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for the host of `url`; returns the delay to wait."""
+        return self._bucket(urlparse(url).netloc).reserve()
+    
+    def acquire(self, url: str):
+        """Block until a request to the host of `url` is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
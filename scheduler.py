@@ -0,0 +1,147 @@
+"""
+Heap-based task scheduler.
+Tasks run on their own threads at a fixed interval; the scheduler thread
+sleeps until the next task is due instead of polling. If a task is still
+running when it comes due again, that run is skipped or coalesced into one
+follow-up run, so slow cycles never pile up.
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional
+
+OVERLAP_POLICIES = ('skip', 'coalesce')
+
+
+class ScheduledTask:
+    """A function run every `interval` seconds."""
+    
+    def __init__(self, name: str, func: Callable, interval: float,
+                 deadline: Optional[float] = None, overlap: str = 'skip'):
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"overlap must be one of {OVERLAP_POLICIES}, got {overlap!r}")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        # Runs longer than this (seconds) are reported as overrunning
+        self.deadline = deadline
+        self.overlap = overlap
+        self.next_run = 0.0
+        self.running = False
+        self.pending = False
+        self.started_at = None
+        self.overrun_reported = False
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+
+
+class Scheduler:
+    """
+    Runs ScheduledTasks from a heap ordered by next due time.
+    add() may be called before or while run() is active; stop() wakes the
+    scheduler and makes run() return.
+    """
+    
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.tasks: List[ScheduledTask] = []
+    
+    def add(self, name: str, func: Callable, interval: float, run_now: bool = True,
+            deadline: Optional[float] = None, overlap: str = 'skip') -> ScheduledTask:
+        """Schedule `func` every `interval` seconds (first run now, or after one interval)."""
+        task = ScheduledTask(name, func, interval, deadline, overlap)
+        task.next_run = time.monotonic() + (0 if run_now else interval)
+        with self.condition:
+            self.tasks.append(task)
+            self._push(task)
+            self.condition.notify()
+        return task
+    
+    def _push(self, task: ScheduledTask):
+        heapq.heappush(self.heap, (task.next_run, next(self.counter), task))
+    
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+    
+    def run(self):
+        """Dispatch due tasks until stop() is called."""
+        with self.condition:
+            while not self.stopped:
+                now = time.monotonic()
+                self._check_deadlines(now)
+                
+                if self.heap and self.heap[0][0] <= now:
+                    _, _, task = heapq.heappop(self.heap)
+                    self._dispatch(task, now)
+                    continue
+                
+                timeout = self.heap[0][0] - now if self.heap else None
+                deadline_timeout = self._next_deadline(now)
+                if deadline_timeout is not None:
+                    timeout = deadline_timeout if timeout is None else min(timeout, deadline_timeout)
+                self.condition.wait(timeout)
+    
+    def _dispatch(self, task: ScheduledTask, now: float):
+        """Start a due task, or skip/coalesce it if the previous run is still going."""
+        # Fixed-rate schedule; runs missed while the process was busy are not replayed
+        task.next_run += task.interval
+        if task.next_run <= now:
+            task.next_run = now + task.interval
+        self._push(task)
+        
+        if task.running:
+            if task.overlap == 'coalesce' and not task.pending:
+                task.pending = True
+                print(f"⏭️  {task.name} still running; will run again as soon as it finishes")
+            else:
+                task.skipped += 1
+                print(f"⏭️  {task.name} still running; skipping this run")
+            return
+        
+        self._start(task)
+    
+    def _start(self, task: ScheduledTask):
+        task.running = True
+        task.started_at = time.monotonic()
+        task.overrun_reported = False
+        thread = threading.Thread(target=self._run_task, args=(task,), name=f"task-{task.name}", daemon=True)
+        thread.start()
+    
+    def _run_task(self, task: ScheduledTask):
+        try:
+            task.func()
+        except Exception as e:
+            task.failures += 1
+            print(f"✗ Scheduled task {task.name} failed: {str(e)}")
+        finally:
+            with self.condition:
+                task.running = False
+                task.runs += 1
+                if task.pending and not self.stopped:
+                    task.pending = False
+                    self._start(task)
+                self.condition.notify()
+    
+    def _check_deadlines(self, now: float):
+        for task in self.tasks:
+            if (task.running and task.deadline is not None and not task.overrun_reported
+                    and now - task.started_at >= task.deadline):
+                task.overrun_reported = True
+                print(f"⚠️  {task.name} has been running for {(now - task.started_at) / 60:.1f} minute(s), "
+                      f"past its {task.deadline / 60:.1f} minute deadline")
+    
+    def _next_deadline(self, now: float) -> Optional[float]:
+        """Seconds until the next running task passes its deadline."""
+        waits = [
+            task.started_at + task.deadline - now
+            for task in self.tasks
+            if task.running and task.deadline is not None and not task.overrun_reported
+        ]
+        return max(0.0, min(waits)) if waits else None
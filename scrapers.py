@@ -1,108 +1,423 @@
 """
 Job board scraper modules.
-Each scraper should return a list of job dictionaries with standardized fields.
+Each scraper should return a list of Job records with standardized fields
+(scrape_jobs), or stream them board by board (iter_jobs / iter_board_jobs).
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterator, NamedTuple, Optional, Tuple
+import atexit
 import hashlib
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlencode, quote_plus
 
+from board_health import BoardHealthTracker
+from company_registry import CompanyRegistry, get_registry
+from fingerprints import BoardFingerprintStore
+from http_cache import ResponseCache
+from json_stream import iter_records
+from matcher import get_matcher
+from models import Job
+from parse_pool import ParsePool
+from parsers import HTMLParserBackend, get_parser
+from poll_planner import PollPlanner
+from rate_limiter import HostRateLimiter
+
+
+_print_lock = threading.Lock()
+
+
+def log(message: str):
+    """print() that doesn't interleave lines written by concurrent board workers."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+class BoardResult(NamedTuple):
+    """
+    One board's jobs. `commit`, if set, saves the board's cache state (HTTP
+    validators and content fingerprint) and must be called once the jobs
+    have been stored, so an unchanged board is only skipped if its jobs are
+    in the database.
+    """
+    jobs: List[Job]
+    commit: Optional[Callable[[], None]] = None
+
 
 class JobScraper:
-    """Base class for job scrapers."""
+    """
+    Base class for job scrapers.
+    Subclasses split their work into independent "boards" (a company board or a
+    keyword+location search) which are fetched concurrently by a bounded pool.
+    """
+    
+    # Request timeout in seconds
+    timeout = 10
+    
+    # Parse in the process pool (if configured); worthwhile for HTML pages
+    parse_in_pool = False
     
-    def __init__(self, user_agent: str):
+    def __init__(self, user_agent: str, fetch_workers: int = 8,
+                 rate_limiter: HostRateLimiter = None, response_cache: ResponseCache = None,
+                 fingerprints: BoardFingerprintStore = None, html_parser: HTMLParserBackend = None,
+                 registry: CompanyRegistry = None, health: BoardHealthTracker = None,
+                 poll_planner: PollPlanner = None, parse_pool: ParsePool = None):
         self.user_agent = user_agent
+        self.fetch_workers = max(1, fetch_workers)
+        # Shared across scrapers so each host's budget is enforced globally
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        # Optional ETag/Last-Modified cache; None disables conditional requests
+        self.response_cache = response_cache
+        # Optional per-board body fingerprints; identical bodies are not re-parsed
+        self.fingerprints = fingerprints
+        # Backend used by the HTML scrapers (Indeed, LinkedIn, Ashby)
+        self.html_parser = html_parser or get_parser()
+        # Company boards and display names for the ATS scrapers
+        self.registry = registry or get_registry()
+        # Optional per-board health; boards that keep failing are backed off
+        self.health = health
+        # Optional adaptive polling; boards not selected this cycle are skipped
+        self.poll_planner = poll_planner
+        # Optional process pool for CPU-bound parsing (used if parse_in_pool)
+        self.parse_pool = parse_pool
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': user_agent})
+        # Let every worker thread keep its own keep-alive connection
+        adapter = requests.adapters.HTTPAdapter(pool_connections=self.fetch_workers,
+                                                pool_maxsize=self.fetch_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def generate_job_id(self, title: str, company: str, url: str) -> str:
         """Generate a unique job ID based on title, company, and URL."""
         unique_string = f"{title}{company}{url}"
         return hashlib.md5(unique_string.encode()).hexdigest()
+    
+    def fetch(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL once the per-host rate limiter allows it."""
+        self.rate_limiter.acquire(url)
+        return self.session.get(url, **kwargs)
+    
+    def cache_variant(self, keywords: List[str], locations: List[str], max_jobs: int) -> str:
+        """Fingerprint of the search filters a cached response was parsed with."""
+        filters = json.dumps([sorted(keywords or []), sorted(locations or []), max_jobs])
+        return hashlib.md5(filters.encode()).hexdigest()
+    
+    def cache_headers(self, url: str, variant: str) -> Dict[str, str]:
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.conditional_headers(url, variant)
+    
+    @property
+    def name(self) -> str:
+        """Human readable name used in log output (e.g. 'Greenhouse')."""
+        return self.__class__.__name__.replace('Scraper', '')
+    
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        """Return the units of work (boards or searches) to scrape this cycle."""
+        return []
+    
+    def board_keys(self, keywords: List[str], locations: List[str]) -> List[str]:
+        return [self.board_key(board) for board in self.get_boards(keywords, locations)]
+    
+    def boards_to_check(self, keywords: List[str], locations: List[str]) -> List:
+        """
+        get_boards() minus the boards currently backed off by the health
+        tracker and those the poll planner did not select this cycle.
+        """
+        boards = self.get_boards(keywords, locations)
+        if self.health is not None:
+            active = [board for board in boards if self.health.should_check(self.board_key(board))]
+            if len(active) < len(boards):
+                log(f"  {self.name}: skipping {len(boards) - len(active)} backed-off board(s)")
+            boards = active
+        
+        if self.poll_planner is not None:
+            due = [board for board in boards if self.poll_planner.is_due(self.board_key(board))]
+            if len(due) < len(boards):
+                log(f"  {self.name}: {len(boards) - len(due)} board(s) deferred to a later cycle (poll budget)")
+            boards = due
+        return boards
+    
+    def board_label(self, board) -> str:
+        """Short board description for log output."""
+        return str(board)
+    
+    def board_key(self, board) -> str:
+        """Stable identifier for a board, e.g. 'greenhouse-stripe'."""
+        return f"{self.name.lower()}-{self.board_label(board)}"
+    
+    def board_fingerprint(self, content: bytes, variant: str) -> str:
+        """Fingerprint of a board response as parsed with the given filters."""
+        return hashlib.blake2b(content, digest_size=16, key=variant.encode()[:64]).hexdigest()
+    
+    def company_name(self, board: str) -> str:
+        """Display name of a company board: the registry's name, else derived from the slug."""
+        name = self.registry.display_name(self.name.lower(), board)
+        return name or board.split('.')[0].replace('-', ' ').title()
+    
+    def board_urls(self, board) -> List[str]:
+        """URLs to try for a board, in order; the first 200 response wins."""
+        raise NotImplementedError
+    
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Turn a board's response body into Job records."""
+        raise NotImplementedError
+    
+    def parse(self, board, content: bytes, keywords: List[str],
+              locations: List[str], max_jobs: int) -> List[Job]:
+        """parse_board(), in the parse process pool when this scraper uses one."""
+        if self.parse_pool is not None and self.parse_in_pool:
+            return self.parse_pool.parse(self, board, content, keywords, locations, max_jobs)
+        return self.parse_board(board, content, keywords, locations, max_jobs)
+    
+    def scrape_board(self, board, keywords: List[str], locations: List[str], max_jobs: int,
+                     conditional: bool = True) -> BoardResult:
+        """
+        Fetch and parse a single board. Never raises; returns no jobs on failure.
+        With conditional=False the board is always fetched and parsed in full.
+        """
+        variant = self.cache_variant(keywords, locations, max_jobs)
+        started = time.monotonic()
+        try:
+            url, response = None, None
+            for url in self.board_urls(board):
+                headers = self.cache_headers(url, variant) if conditional else {}
+                response = self.fetch(url, timeout=self.timeout, headers=headers)
+                if response.status_code in (200, 304):
+                    break
+        except Exception as e:
+            self.record_health(board, None, time.monotonic() - started)
+            log(f"  {self.board_label(board)}: ✗ {self.name} scraping error: {str(e)}")
+            return BoardResult([])
+        
+        self.record_health(board, response)
+        try:
+            return self.process_response(board, url, response, variant, keywords, locations, max_jobs, conditional)
+        except Exception as e:
+            log(f"  {self.board_label(board)}: ✗ {self.name} scraping error: {str(e)}")
+            return BoardResult([])
+    
+    def record_health(self, board, response, elapsed: float = None):
+        """Report a board's fetch outcome to the health tracker (response None = request error)."""
+        if self.health is None:
+            return
+        status = None
+        if response is not None:
+            status, elapsed = response.status_code, response.elapsed.total_seconds()
+        self.health.record(self.board_key(board), status, elapsed)
+    
+    def process_response(self, board, url: str, response, variant: str, keywords: List[str],
+                         locations: List[str], max_jobs: int, conditional: bool = True) -> BoardResult:
+        """
+        Parse a board response (shared by the sync and async backends).
+        A 304, or a body identical to the last one parsed, means the board is
+        unchanged since its jobs were last stored, so parsing is skipped.
+        With conditional=False every body is parsed and no cache state is
+        returned to commit.
+        """
+        label = self.board_label(board)
+        if response is None or response.status_code not in (200, 304):
+            status = response.status_code if response is not None else 'no request'
+            log(f"  {label}: ✗ Failed ({status})")
+            return BoardResult([])
+        
+        if not conditional:
+            jobs = self.parse(board, response.content, keywords, locations, max_jobs)
+            self.report_board(label, jobs)
+            return BoardResult(jobs)
+        
+        if self.response_cache is not None:
+            self.response_cache.record(not_modified=response.status_code == 304)
+        
+        key = self.board_key(board)
+        if response.status_code == 304:
+            if self.fingerprints is not None:
+                self.fingerprints.not_modified(key)
+            log(f"  {label}: ⊘ Unchanged since last check")
+            return BoardResult([])
+        
+        fingerprint = None
+        if self.fingerprints is not None:
+            fingerprint = self.board_fingerprint(response.content, variant)
+            if self.fingerprints.is_unchanged(key, fingerprint):
+                log(f"  {label}: ⊘ Unchanged since last check (same content)")
+                return BoardResult([])
+        
+        jobs = self.parse(board, response.content, keywords, locations, max_jobs)
+        self.report_board(label, jobs)
+        if self.response_cache is None and fingerprint is None:
+            return BoardResult(jobs)
+        
+        # Validators and fingerprint are saved by the consumer, after the jobs are stored
+        validators = {name: response.headers.get(name) for name in ('ETag', 'Last-Modified')}
+        
+        def commit():
+            if self.response_cache is not None:
+                self.response_cache.store(url, validators, variant)
+            if fingerprint is not None:
+                self.fingerprints.update(key, fingerprint)
+        return BoardResult(jobs, commit)
+    
+    def report_board(self, label: str, jobs: List[Job]):
+        if jobs:
+            log(f"  {label}: ✓ Found {len(jobs)} internship(s)")
+        else:
+            log(f"  {label}: ⊘ No internships")
+    
+    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Job]:
+        """
+        Scrape every board through a bounded worker pool.
+        Results are merged in board order, so the output is deterministic
+        regardless of which board responds first. Every board is fetched in
+        full (no conditional requests or fingerprint skips), since nothing here
+        commits cache state; use iter_board_jobs for incremental scraping.
+        """
+        boards = self.boards_to_check(keywords, locations)
+        if not boards:
+            return []
+        
+        workers = min(self.fetch_workers, len(boards))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda board: self.scrape_board(board, keywords, locations, max_jobs, conditional=False),
+                boards
+            )
+            return self.merge_results(results)
+    
+    def iter_board_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> Iterator[BoardResult]:
+        """
+        Yield each board's result as soon as that board has been parsed, in
+        completion order. Jobs already yielded for an earlier board are dropped.
+        Only in-flight boards are held in memory. Call each result's commit()
+        once its jobs have been stored.
+        """
+        boards = self.boards_to_check(keywords, locations)
+        if not boards:
+            return
+        
+        seen = set()
+        workers = min(self.fetch_workers, len(boards))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.scrape_board, board, keywords, locations, max_jobs)
+                for board in boards
+            ]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    board_jobs = self.drop_seen(result.jobs, seen)
+                    if board_jobs or result.commit is not None:
+                        yield BoardResult(board_jobs, result.commit)
+            finally:
+                # If the consumer stops early, drop the boards not started yet
+                for future in futures:
+                    future.cancel()
+    
+    def iter_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> Iterator[Job]:
+        """
+        Generator version of scrape_jobs: yields jobs as their boards finish.
+        A board's cache state is saved when the generator resumes after its
+        last job, i.e. once the caller has handled them.
+        """
+        for result in self.iter_board_jobs(keywords, locations, max_jobs):
+            yield from result.jobs
+            if result.commit is not None:
+                result.commit()
+    
+    def merge_results(self, results: Iterator[BoardResult]) -> List[Job]:
+        """Concatenate per-board results, dropping jobs seen on an earlier board."""
+        jobs = []
+        seen = set()
+        for result in results:
+            jobs.extend(self.drop_seen(result.jobs, seen))
+        return jobs
+    
+    @staticmethod
+    def drop_seen(jobs: List[Job], seen: set) -> List[Job]:
+        """Return the jobs whose job_id is not in `seen`, adding them to it."""
+        fresh = []
+        for job in jobs:
+            if job.job_id in seen:
+                continue
+            seen.add(job.job_id)
+            fresh.append(job)
+        return fresh
 
 
 class IndeedScraper(JobScraper):
     """Scraper for Indeed.com"""
     
-    def __init__(self, user_agent: str):
-        super().__init__(user_agent)
+    parse_in_pool = True
+    
+    def __init__(self, user_agent: str, searches: List[Tuple[str, str]] = None, **kwargs):
+        super().__init__(user_agent, **kwargs)
         self.base_url = "https://www.indeed.com"
+        # Explicit (keyword, location) searches, e.g. one set per subscriber
+        self.searches = searches
+    
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        """The configured searches, or every keyword+location pair as a separate search."""
+        if self.searches:
+            return list(self.searches)
+        return [(keyword, location) for keyword in keywords for location in locations]
+    
+    def board_label(self, board) -> str:
+        keyword, location = board
+        return f"'{keyword}' in {location}"
     
-    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Dict]:
-        """Scrape jobs from Indeed."""
+    def board_urls(self, board) -> List[str]:
+        keyword, location = board
+        params = {
+            'q': keyword,
+            'l': location,
+            'sort': 'date'  # Sort by date to get newest first
+        }
+        return [f"{self.base_url}/jobs?{urlencode(params)}"]
+    
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse one Indeed search results page."""
+        keyword, location = board
         jobs = []
+        matcher = get_matcher(keywords, locations)
         
-        for keyword in keywords:
-            for location in locations:
-                try:
-                    search_url = f"{self.base_url}/jobs"
-                    params = {
-                        'q': keyword,
-                        'l': location,
-                        'sort': 'date'  # Sort by date to get newest first
-                    }
-                    
-                    full_url = f"{search_url}?{urlencode(params)}"
-                    
-                    response = self.session.get(full_url, timeout=10)
-                    if response.status_code != 200:
-                        print(f"✗ Indeed: Failed to fetch results (status {response.status_code})")
-                        continue
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Indeed's structure may change, this is a basic example
-                    job_cards = soup.find_all('div', class_='job_seen_beacon')
-                    
-                    for card in job_cards[:max_jobs]:
-                        try:
-                            title_elem = card.find('h2', class_='jobTitle')
-                            company_elem = card.find('span', {'data-testid': 'company-name'})
-                            location_elem = card.find('div', {'data-testid': 'text-location'})
-                            
-                            if not title_elem:
-                                continue
-                            
-                            title = title_elem.get_text(strip=True)
-                            
-                            # Filter for internships only
-                            if 'intern' not in title.lower():
-                                continue
-                            
-                            company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-                            job_location = location_elem.get_text(strip=True) if location_elem else location
-                            
-                            # Get job URL
-                            link = title_elem.find('a')
-                            if link and link.get('href'):
-                                job_url = f"{self.base_url}{link['href']}"
-                            else:
-                                continue
-                            
-                            job_data = {
-                                'job_id': self.generate_job_id(title, company, job_url),
-                                'title': title,
-                                'company': company,
-                                'location': job_location,
-                                'url': job_url,
-                                'source': 'indeed',
-                                'description': ''
-                            }
-                            
-                            jobs.append(job_data)
-                            
-                        except Exception as e:
-                            print(f"✗ Error parsing Indeed job card: {str(e)}")
-                            continue
-                    
-                    time.sleep(2)  # Be respectful with rate limiting
-                    
-                except Exception as e:
-                    print(f"✗ Indeed scraping error: {str(e)}")
+        # Indeed's structure may change, this is a basic example
+        for card in self.html_parser.indeed_cards(content, max_jobs):
+            try:
+                title = card['title']
+                
+                # Filter for internships only
+                if not matcher.is_internship(title):
                     continue
+                
+                company = card['company'] if card['company'] is not None else 'N/A'
+                job_location = card['location'] if card['location'] is not None else location
+                
+                # Get job URL
+                if card['href']:
+                    job_url = f"{self.base_url}{card['href']}"
+                else:
+                    continue
+                
+                job_data = Job(
+                    job_id=self.generate_job_id(title, company, job_url),
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    url=job_url,
+                    source='indeed',
+                    description=''
+                )
+                
+                jobs.append(job_data)
+            
+            except Exception as e:
+                log(f"✗ Error parsing Indeed job card: {str(e)}")
+                continue
         
         return jobs
 
@@ -110,126 +425,108 @@ class IndeedScraper(JobScraper):
 class LinkedInScraper(JobScraper):
     """Scraper for LinkedIn Jobs (requires authentication for best results)"""
     
-    def __init__(self, user_agent: str):
-        super().__init__(user_agent)
+    timeout = 5
+    parse_in_pool = True
+    
+    # OPTIMIZATION: Strategic keyword+location combos to cover all internship types
+    # Covers: Software Engineering, Data Science, ML/AI, Backend, Frontend, Full Stack
+    SEARCH_COMBOS = [
+        # Software Engineering internships
+        ('software engineering intern', 'United States'),
+        ('software engineer intern', 'Remote'),
+        ('swe intern', 'United States'),
+        
+        # Data Science & ML internships
+        ('data science intern', 'United States'),
+        ('machine learning intern', 'United States'),
+        ('ai intern', 'Remote'),
+        
+        # Specific tech roles
+        ('backend intern', 'United States'),
+        ('frontend intern', 'United States'),
+        ('full stack intern', 'Remote'),
+        
+        # Python & General CS
+        ('python intern', 'United States'),
+        ('computer science intern', 'United States'),
+        
+        # Just "intern" to catch everything
+        ('software intern', 'United States'),
+        ('engineering intern', 'Remote'),
+    ]
+    
+    def __init__(self, user_agent: str, **kwargs):
+        super().__init__(user_agent, **kwargs)
         self.base_url = "https://www.linkedin.com"
     
-    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Dict]:
-        """Scrape jobs from LinkedIn - optimized to do fewer searches."""
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        """LinkedIn uses a fixed set of searches - optimized to do fewer requests."""
+        return list(self.SEARCH_COMBOS)
+    
+    def boards_to_check(self, keywords: List[str], locations: List[str]) -> List:
+        # Logged here rather than in get_boards, which the poll planner also calls
+        boards = super().boards_to_check(keywords, locations)
+        log(f"  Searching {len(boards)} keyword+location combinations...")
+        return boards
+    
+    def board_label(self, board) -> str:
+        keyword, location = board
+        return f"'{keyword}' in {location}"
+    
+    def board_urls(self, board) -> List[str]:
+        keyword, location = board
+        # LinkedIn's public job search endpoint
+        params = {
+            'keywords': keyword,
+            'location': location,
+            'sortBy': 'DD',  # Sort by date (most recent first)
+            'start': 0,
+            'f_TPR': 'r86400'  # Posted in last 24 hours
+        }
+        return [f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"]
+    
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse one LinkedIn keyword+location search page."""
+        keyword, location = board
         jobs = []
         jobs_found = set()  # Track unique jobs to avoid duplicates
         
-        # OPTIMIZATION: Strategic keyword+location combos to cover all internship types
-        # Covers: Software Engineering, Data Science, ML/AI, Backend, Frontend, Full Stack
-        search_combos = [
-            # Software Engineering internships
-            ('software engineering intern', 'United States'),
-            ('software engineer intern', 'Remote'),
-            ('swe intern', 'United States'),
-            
-            # Data Science & ML internships
-            ('data science intern', 'United States'),
-            ('machine learning intern', 'United States'),
-            ('ai intern', 'Remote'),
-            
-            # Specific tech roles
-            ('backend intern', 'United States'),
-            ('frontend intern', 'United States'),
-            ('full stack intern', 'Remote'),
-            
-            # Python & General CS
-            ('python intern', 'United States'),
-            ('computer science intern', 'United States'),
-            
-            # Just "intern" to catch everything
-            ('software intern', 'United States'),
-            ('engineering intern', 'Remote'),
-        ]
+        matcher = get_matcher(keywords, locations)
         
-        print(f"  Searching {len(search_combos)} keyword+location combinations...")
-        
-        for i, (keyword, location) in enumerate(search_combos, 1):
+        for card in self.html_parser.linkedin_cards(content, max_jobs):
             try:
-                print(f"  [{i}/{len(search_combos)}] '{keyword}' in {location}...", end=' ')
-                
-                # LinkedIn's public job search endpoint
-                search_url = f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search"
-                params = {
-                    'keywords': keyword,
-                    'location': location,
-                    'sortBy': 'DD',  # Sort by date (most recent first)
-                    'start': 0,
-                    'f_TPR': 'r86400'  # Posted in last 24 hours
-                }
-                
-                response = self.session.get(search_url, params=params, timeout=5)
-                
-                if response.status_code != 200:
-                    print(f"✗ Failed ({response.status_code})")
+                title = card['title']
+                job_url = card['href']
+                
+                # Skip if we've already found this job
+                if job_url in jobs_found:
                     continue
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('li')
-                
-                internships_found = 0
-                
-                for card in job_cards[:max_jobs]:
-                    try:
-                        base_card = card.find('div', class_='base-card')
-                        if not base_card:
-                            continue
-                        
-                        title_elem = base_card.find('h3', class_='base-search-card__title')
-                        company_elem = base_card.find('h4', class_='base-search-card__subtitle')
-                        location_elem = base_card.find('span', class_='job-search-card__location')
-                        link_elem = base_card.find('a', class_='base-card__full-link')
-                        
-                        if not title_elem or not link_elem:
-                            continue
-                        
-                        title = title_elem.get_text(strip=True)
-                        job_url = link_elem.get('href', '')
-                        
-                        # Skip if we've already found this job
-                        if job_url in jobs_found:
-                            continue
-                        
-                        # Filter for internships only
-                        if 'intern' not in title.lower():
-                            continue
-                        
-                        company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-                        job_location = location_elem.get_text(strip=True) if location_elem else location
-                        
-                        if not job_url:
-                            continue
-                        
-                        job_data = {
-                            'job_id': self.generate_job_id(title, company, job_url),
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'url': job_url,
-                            'source': 'linkedin',
-                            'description': ''
-                        }
-                        
-                        jobs.append(job_data)
-                        jobs_found.add(job_url)
-                        internships_found += 1
-                        
-                    except Exception as e:
-                        continue
-                
-                if internships_found > 0:
-                    print(f"✓ Found {internships_found} internship(s)")
-                else:
-                    print("⊘ No internships")
+                # Filter for internships only
+                if not matcher.is_internship(title):
+                    continue
                 
-                time.sleep(1)  # Rate limiting
+                company = card['company'] if card['company'] is not None else 'N/A'
+                job_location = card['location'] if card['location'] is not None else location
                 
+                if not job_url:
+                    continue
+                
+                job_data = Job(
+                    job_id=self.generate_job_id(title, company, job_url),
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    url=job_url,
+                    source='linkedin',
+                    description=''
+                )
+                
+                jobs.append(job_data)
+                jobs_found.add(job_url)
+            
             except Exception as e:
-                print(f"✗ Error")
                 continue
         
         return jobs
@@ -241,76 +538,71 @@ class GreenhouseScraper(JobScraper):
     You can add specific company boards here.
     """
     
-    def __init__(self, user_agent: str, company_boards: List[str] = None):
-        super().__init__(user_agent)
-        # Example company boards: ['company1.greenhouse.io', 'company2.greenhouse.io']
-        self.company_boards = company_boards or []
+    timeout = 5
+    # Posting fields read from the board API (path -> name)
+    fields = {
+        'title': 'title',
+        'location.name': 'location',
+        'location': 'location',
+        'absolute_url': 'url',
+        'content': 'description',
+    }
+    
+    def __init__(self, user_agent: str, company_boards: List[str] = None, **kwargs):
+        super().__init__(user_agent, **kwargs)
+        # Board tokens, e.g. ['stripe', 'airbnb']; defaults to every registry board
+        self.company_boards = company_boards if company_boards is not None else self.registry.boards('greenhouse')
     
-    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Dict]:
-        """Scrape jobs from Greenhouse company boards."""
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        return list(self.company_boards)
+    
+    def board_urls(self, board) -> List[str]:
+        return [f"https://boards-api.greenhouse.io/v1/boards/{board.split('.')[0]}/jobs"]
+    
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse one Greenhouse board API response."""
         jobs = []
+        matcher = get_matcher(keywords, locations)
         
-        for i, board in enumerate(self.company_boards, 1):
+        # Most boards list no internships at all; don't decode those
+        if not matcher.may_contain_internship(content):
+            return jobs
+        
+        for job in iter_records(content, 'jobs.item', self.fields, max_jobs, truncate={'description': 500}):
             try:
-                print(f"  [{i}/{len(self.company_boards)}] Checking {board}...", end=' ')
-                api_url = f"https://boards-api.greenhouse.io/v1/boards/{board.split('.')[0]}/jobs"
+                title = job['title'] or ''
                 
-                response = self.session.get(api_url, timeout=5)
-                if response.status_code != 200:
-                    print(f"✗ Failed")
+                # Filter for internships only
+                if not matcher.is_internship(title):
                     continue
                 
-                data = response.json()
-                internship_count = 0
-                
-                for job in data.get('jobs', [])[:max_jobs]:
-                    try:
-                        title = job.get('title', '')
-                        
-                        # Filter for internships only
-                        if 'intern' not in title.lower():
-                            continue
-                        
-                        location_obj = job.get('location', {})
-                        job_location = location_obj.get('name', 'N/A') if isinstance(location_obj, dict) else str(location_obj)
-                        job_url = job.get('absolute_url', '')
-                        company = board.split('.')[0].replace('-', ' ').title()
-                        
-                        # Filter by keywords if specified
-                        if keywords:
-                            if not any(kw.lower() in title.lower() for kw in keywords):
-                                continue
-                        
-                        # Filter for US locations
-                        if locations and location_obj:
-                            if not any(loc.lower() in job_location.lower() for loc in locations):
-                                continue
-                        
-                        job_data = {
-                            'job_id': self.generate_job_id(title, company, job_url),
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'url': job_url,
-                            'source': f'greenhouse-{board}',
-                            'description': job.get('content', '')[:500]
-                        }
-                        
-                        jobs.append(job_data)
-                        internship_count += 1
-                        
-                    except Exception as e:
-                        continue
-                
-                if internship_count > 0:
-                    print(f"✓ Found {internship_count} internship(s)")
-                else:
-                    print("⊘ No internships")
+                location = job['location']
+                job_location = str(location) if location is not None else 'N/A'
+                job_url = job['url'] or ''
+                company = self.company_name(board)
                 
-                time.sleep(0.5)  # Reduced delay
+                # Filter by keywords if specified
+                if not matcher.matches_keywords(title):
+                    continue
+                
+                # Filter for US locations
+                if location is not None and not matcher.matches_location(job_location):
+                    continue
+                
+                job_data = Job(
+                    job_id=self.generate_job_id(title, company, job_url),
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    url=job_url,
+                    source=f'greenhouse-{board}',
+                    description=job['description'] or ''
+                )
                 
+                jobs.append(job_data)
+            
             except Exception as e:
-                print(f"✗ Greenhouse scraping error for {board}: {str(e)}")
                 continue
         
         return jobs
@@ -322,103 +614,68 @@ class AshbyScraper(JobScraper):
     Ashby is used by many startups and tech companies.
     """
     
-    def __init__(self, user_agent: str, company_boards: List[str] = None):
-        super().__init__(user_agent)
-        # List of known Ashby job boards
-        self.company_boards = company_boards or [
-            # Big tech and well-known companies
-            'ramp.com',
-            'varda.com',
-            'anduril.com',
-            'astranis.com',
-            'rippling.com',
-            'watershed.com',
-            'anthropic.com',
-            'scale.com',
-            'retool.com',
-            'notion.so',
-            # Add more companies as you discover them
+    parse_in_pool = True
+    
+    def __init__(self, user_agent: str, company_boards: List[str] = None, **kwargs):
+        super().__init__(user_agent, **kwargs)
+        # Company domains, e.g. ['ramp.com']; defaults to every registry board
+        self.company_boards = company_boards if company_boards is not None else self.registry.boards('ashby')
+    
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        return list(self.company_boards)
+    
+    def board_urls(self, board) -> List[str]:
+        # Ashby typically uses jobs.ashbyhq.com or jobs.<company>.com
+        return [
+            f"https://jobs.ashbyhq.com/{board.split('.')[0]}",
+            f"https://jobs.{board}",
         ]
     
-    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Dict]:
-        """Scrape jobs from Ashby company boards."""
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse one Ashby company board page."""
         jobs = []
+        matcher = get_matcher(keywords, locations)
         
-        for board in self.company_boards:
+        # Look for job listings - Ashby structure varies
+        for card in self.html_parser.ashby_cards(content, max_jobs):
             try:
-                # Ashby typically uses jobs.ashbyhq.com or jobs.<company>.com
-                api_url = f"https://jobs.ashbyhq.com/{board.split('.')[0]}"
-                
-                response = self.session.get(api_url, timeout=10)
-                if response.status_code != 200:
-                    # Try alternative format
-                    api_url = f"https://jobs.{board}"
-                    response = self.session.get(api_url, timeout=10)
-                    if response.status_code != 200:
-                        print(f"✗ Ashby ({board}): Failed to fetch results")
-                        continue
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job listings - Ashby structure varies
-                job_cards = soup.find_all(['div', 'a'], class_=lambda x: x and ('job' in x.lower() or 'posting' in x.lower()))
-                
-                for card in job_cards[:max_jobs]:
-                    try:
-                        # Try to extract job information
-                        title_elem = card.find(['h3', 'h2', 'span'], class_=lambda x: x and 'title' in x.lower())
-                        if not title_elem:
-                            title_elem = card.find('a')
-                        
-                        if not title_elem:
-                            continue
-                        
-                        title = title_elem.get_text(strip=True)
-                        
-                        # Filter for internships only
-                        if not any(kw.lower() in title.lower() for kw in ['intern']):
-                            continue
-                        
-                        # Filter by keywords
-                        if keywords:
-                            if not any(kw.lower() in title.lower() for kw in keywords):
-                                continue
-                        
-                        # Get job URL
-                        link = card.find('a') or card
-                        job_url = link.get('href', '') if link.name == 'a' else ''
-                        if job_url and not job_url.startswith('http'):
-                            job_url = f"https://jobs.ashbyhq.com{job_url}"
-                        
-                        if not job_url:
-                            continue
-                        
-                        # Try to get location
-                        location_elem = card.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                        job_location = location_elem.get_text(strip=True) if location_elem else 'United States'
-                        
-                        company = board.split('.')[0].replace('-', ' ').title()
-                        
-                        job_data = {
-                            'job_id': self.generate_job_id(title, company, job_url),
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'url': job_url,
-                            'source': f'ashby-{board}',
-                            'description': ''
-                        }
-                        
-                        jobs.append(job_data)
-                        
-                    except Exception as e:
-                        print(f"✗ Error parsing Ashby job: {str(e)}")
-                        continue
-                
-                time.sleep(1)
+                title = card['title']
                 
+                # Filter for internships only
+                if not matcher.is_internship(title):
+                    continue
+                
+                # Filter by keywords
+                if not matcher.matches_keywords(title):
+                    continue
+                
+                # Get job URL
+                job_url = card['href']
+                if job_url and not job_url.startswith('http'):
+                    job_url = f"https://jobs.ashbyhq.com{job_url}"
+                
+                if not job_url:
+                    continue
+                
+                job_location = card['location'] if card['location'] is not None else 'United States'
+                
+                company = self.company_name(board)
+                
+                job_data = Job(
+                    job_id=self.generate_job_id(title, company, job_url),
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    url=job_url,
+                    source=f'ashby-{board}',
+                    description=''
+                )
+                
+                jobs.append(job_data)
+            
             except Exception as e:
-                print(f"✗ Ashby scraping error for {board}: {str(e)}")
+                log(f"✗ Error parsing Ashby job: {str(e)}")
                 continue
         
         return jobs
@@ -430,132 +687,149 @@ class LeverScraper(JobScraper):
     Lever is used by many startups and tech companies.
     """
     
-    def __init__(self, user_agent: str, company_boards: List[str] = None):
-        super().__init__(user_agent)
-        # List of known Lever job boards
-        self.company_boards = company_boards or [
-            # Popular companies using Lever
-            'netflix',
-            'shopify',
-            'canva',
-            'figma',
-            'plaid',
-            'faire',
-            'reddit',
-            'squarespace',
-            'gitlab',
-            'grammarly',
-            # Add more companies
-        ]
+    timeout = 5
+    # Posting fields read from the postings API (path -> name)
+    fields = {
+        'text': 'title',
+        'categories.location': 'location',
+        'hostedUrl': 'url',
+        'description': 'description',
+    }
+    
+    def __init__(self, user_agent: str, company_boards: List[str] = None, **kwargs):
+        super().__init__(user_agent, **kwargs)
+        # Lever account names, e.g. ['netflix']; defaults to every registry board
+        self.company_boards = company_boards if company_boards is not None else self.registry.boards('lever')
     
-    def scrape_jobs(self, keywords: List[str], locations: List[str], max_jobs: int = 50) -> List[Dict]:
-        """Scrape jobs from Lever company boards."""
+    def get_boards(self, keywords: List[str], locations: List[str]) -> List:
+        return list(self.company_boards)
+    
+    def board_urls(self, board) -> List[str]:
+        # Lever API endpoint
+        return [f"https://api.lever.co/v0/postings/{board}"]
+    
+    def parse_board(self, board, content: bytes, keywords: List[str],
+                    locations: List[str], max_jobs: int) -> List[Job]:
+        """Parse one Lever postings API response."""
         jobs = []
+        matcher = get_matcher(keywords, locations)
         
-        for i, board in enumerate(self.company_boards, 1):
+        # Most boards list no internships at all; don't decode those
+        if not matcher.may_contain_internship(content):
+            return jobs
+        
+        for job in iter_records(content, 'item', self.fields, max_jobs, truncate={'description': 500}):
             try:
-                print(f"  [{i}/{len(self.company_boards)}] Checking {board}...", end=' ')
-                # Lever API endpoint
-                api_url = f"https://api.lever.co/v0/postings/{board}"
+                title = job['title'] or ''
                 
-                response = self.session.get(api_url, timeout=5)
-                if response.status_code != 200:
-                    print(f"✗ Failed")
+                # Filter for internships only
+                if not matcher.is_internship(title):
                     continue
                 
-                data = response.json()
-                internship_count = 0
-                
-                for job in data[:max_jobs]:
-                    try:
-                        title = job.get('text', '')
-                        
-                        # Filter for internships only
-                        if 'intern' not in title.lower():
-                            continue
-                        
-                        # Filter by keywords
-                        if keywords:
-                            if not any(kw.lower() in title.lower() for kw in keywords):
-                                continue
-                        
-                        categories = job.get('categories', {})
-                        job_location = categories.get('location', 'United States')
-                        
-                        # Filter by US locations
-                        if locations and 'United States' in locations:
-                            if 'United States' not in job_location and 'US' not in job_location and 'Remote' not in job_location:
-                                # Check if it's a US city
-                                us_cities = ['New York', 'San Francisco', 'Seattle', 'Boston', 'Austin', 'Chicago', 'Los Angeles']
-                                if not any(city in job_location for city in us_cities):
-                                    continue
-                        
-                        job_url = job.get('hostedUrl', '')
-                        company = board.replace('-', ' ').title()
-                        
-                        job_data = {
-                            'job_id': self.generate_job_id(title, company, job_url),
-                            'title': title,
-                            'company': company,
-                            'location': job_location,
-                            'url': job_url,
-                            'source': f'lever-{board}',
-                            'description': job.get('description', '')[:500]
-                        }
-                        
-                        jobs.append(job_data)
-                        internship_count += 1
-                        
-                    except Exception as e:
-                        continue
-                
-                if internship_count > 0:
-                    print(f"✓ Found {internship_count} internship(s)")
-                else:
-                    print("⊘ No internships")
+                # Filter by keywords
+                if not matcher.matches_keywords(title):
+                    continue
+                
+                job_location = job['location'] or 'United States'
+                
+                # Filter by US locations (country, "US", "Remote" or a major US city)
+                if not matcher.matches_us_location(job_location):
+                    continue
+                
+                job_url = job['url'] or ''
+                company = self.company_name(board)
                 
-                time.sleep(0.5)  # Reduced delay
+                job_data = Job(
+                    job_id=self.generate_job_id(title, company, job_url),
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    url=job_url,
+                    source=f'lever-{board}',
+                    description=job['description'] or ''
+                )
                 
+                jobs.append(job_data)
+            
             except Exception as e:
-                print(f"✗ Error")
                 continue
         
         return jobs
 
 
 def get_all_scrapers(config: dict) -> List[JobScraper]:
-    """Initialize and return all enabled scrapers."""
+    """
+    Initialize and return all enabled scrapers.
+    With config['http_backend'] == 'async' the scrapers are returned wrapped in
+    SyncScraperAdapter; both kinds expose scrape_jobs(keywords, locations, max_jobs).
+    """
     scrapers = []
     user_agent = config.get('user_agent', 'Mozilla/5.0')
+    options = {
+        'fetch_workers': config.get('fetch_workers', 8),
+        'rate_limiter': HostRateLimiter(config.get('rate_limits')),
+        'response_cache': ResponseCache(config['http_cache_dir']) if config.get('http_cache_dir') else None,
+        'fingerprints': config.get('fingerprints'),
+        'html_parser': get_parser(config.get('html_parser', 'auto')),
+        'registry': get_registry(config.get('companies_file')),
+        'health': config.get('board_health'),
+        'poll_planner': config.get('poll_planner'),
+        'parse_pool': None,
+    }
+    
+    # Separate parse stage: fetch threads hand page bytes to parser processes
+    if config.get('parse_workers'):
+        options['parse_pool'] = ParsePool(
+            config['parse_workers'],
+            html_parser=config.get('html_parser', 'auto'),
+            companies_file=config.get('companies_file')
+        )
+        atexit.register(options['parse_pool'].close)
     
     job_boards = config.get('job_boards', {})
     
     if job_boards.get('indeed', False):
-        scrapers.append(IndeedScraper(user_agent))
+        scrapers.append(IndeedScraper(user_agent, searches=config.get('indeed_searches'), **options))
     
     if job_boards.get('linkedin', False):
-        scrapers.append(LinkedInScraper(user_agent))
+        scrapers.append(LinkedInScraper(user_agent, **options))
+    
+    # Company boards come from the registry (companies.py + optional data file)
+    registry = options['registry']
     
     if job_boards.get('greenhouse', False):
-        # Top tech companies using Greenhouse - most likely to have internships
-        company_boards = [
-            'airbnb', 'stripe', 'uber', 'robinhood', 'snowflake',
-            'databricks', 'coinbase', 'reddit', 'doordash', 'instacart',
-        ]
-        scrapers.append(GreenhouseScraper(user_agent, company_boards))
+        scrapers.append(GreenhouseScraper(user_agent, registry.boards('greenhouse'), **options))
     
     if job_boards.get('ashby', False):
-        # Top companies using Ashby
-        company_boards = [
-            'ramp.com', 'anthropic.com', 'scale.com',
-        ]
-        scrapers.append(AshbyScraper(user_agent, company_boards))
+        scrapers.append(AshbyScraper(user_agent, registry.boards('ashby'), **options))
     
     if job_boards.get('lever', False):
-        # Top companies using Lever
-        company_boards = [
-            'netflix', 'shopify', 'canva', 'figma', 'plaid',
-        ]
-        scrapers.append(LeverScraper(user_agent, company_boards))
+        scrapers.append(LeverScraper(user_agent, registry.boards('lever'), **options))
+    
+    if config.get('http_backend', 'sync') == 'async':
+        scrapers = _wrap_async(scrapers, config, user_agent, options['rate_limiter'])
     
     return scrapers
+
+
+def _wrap_async(scrapers: List[JobScraper], config: dict, user_agent: str,
+                rate_limiter: HostRateLimiter) -> List:
+    """Run scrapers on the shared asyncio backend, if aiohttp is available."""
+    try:
+        from async_scrapers import AsyncHTTPClient, AsyncJobScraper, SyncScraperAdapter
+        client = AsyncHTTPClient(
+            user_agent,
+            max_connections=config.get('max_connections', 100),
+            rate_limiter=rate_limiter
+        )
+    except ImportError as e:
+        print(f"⚠️  Warning: {str(e)}. Falling back to the threaded HTTP backend.")
+        return scrapers
+    
+    adapters = [
+        SyncScraperAdapter(AsyncJobScraper(scraper, client, max_in_flight=config.get('max_connections', 100)))
+        for scraper in scrapers
+    ]
+    if adapters:
+        atexit.register(adapters[0].close)
+    return adapters
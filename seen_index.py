@@ -0,0 +1,130 @@
+"""
+In-memory membership index of known job IDs.
+A Bloom filter answers "definitely new" without touching SQLite; only
+"maybe seen" answers need a database lookup.
+"""
+import hashlib
+import math
+from typing import Dict, Iterable, Tuple
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` items at `error_rate`."""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.capacity = max(1, int(capacity))
+        self.error_rate = error_rate
+        self.num_bits, self.num_hashes = self.size_for(self.capacity, error_rate)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def size_for(capacity: int, error_rate: float) -> Tuple[int, int]:
+        """Optimal bit count and hash count for the requested false-positive rate."""
+        num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        return num_bits, max(1, round(num_bits / capacity * math.log(2)))
+
+    @staticmethod
+    def expected_false_positive_rate(num_bits: int, num_hashes: int, count: int) -> float:
+        return (1 - math.exp(-num_hashes * count / num_bits)) ** num_hashes
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def is_saturated(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Expected false-positive rate at the current fill level."""
+        return self.expected_false_positive_rate(self.num_bits, self.num_hashes, self.count)
+
+
+class SeenJobIndex:
+    """
+    Bloom filter of job_ids plus lookup counters.
+    Grows (by rebuilding at twice the capacity) when it fills up.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.error_rate = error_rate
+        self.filter = BloomFilter(capacity, error_rate)
+        self.lookups = 0
+        self.negatives = 0
+        self.false_positives = 0
+
+    def load(self, job_ids: Iterable[str], expected: int = 0):
+        """Rebuild the filter from all known job_ids."""
+        capacity = max(self.filter.capacity, expected * 2)
+        self.filter = BloomFilter(capacity, self.error_rate)
+        self.filter.update(job_ids)
+
+    def add(self, job_id: str):
+        self.filter.add(job_id)
+
+    def might_contain(self, job_id: str) -> bool:
+        """False means the job is definitely new; True needs a database check."""
+        self.lookups += 1
+        if job_id in self.filter:
+            return True
+        self.negatives += 1
+        return False
+
+    def record_false_positive(self):
+        """Called when a "maybe seen" answer turned out to be new."""
+        self.false_positives += 1
+
+    @property
+    def needs_resize(self) -> bool:
+        return self.filter.is_saturated
+
+    def stats(self) -> Dict:
+        maybe_seen = self.lookups - self.negatives
+        return {
+            'entries': self.filter.count,
+            'capacity': self.filter.capacity,
+            'memory_bytes': self.filter.memory_bytes,
+            'hash_functions': self.filter.num_hashes,
+            'false_positive_rate': self.filter.false_positive_rate,
+            'observed_false_positive_rate': self.false_positives / maybe_seen if maybe_seen else 0.0,
+            'lookups': self.lookups,
+            'db_lookups_skipped': self.negatives,
+            'loaded': True,
+        }
+
+    @staticmethod
+    def estimate(entries: int, capacity: int = 100000, error_rate: float = 0.001) -> Dict:
+        """Sizing the index would have once loaded with `entries` job_ids, without building it."""
+        capacity = max(1, int(capacity), entries * 2)
+        num_bits, num_hashes = BloomFilter.size_for(capacity, error_rate)
+        return {
+            'entries': entries,
+            'capacity': capacity,
+            'memory_bytes': (num_bits + 7) // 8,
+            'hash_functions': num_hashes,
+            'false_positive_rate': BloomFilter.expected_false_positive_rate(num_bits, num_hashes, entries),
+            'loaded': False,
+        }
@@ -0,0 +1,224 @@
+"""
+Background SMTP delivery.
+Alerts are queued and sent by one worker thread over a single authenticated
+connection that is kept open between messages, so a check cycle never waits
+on the mail server and several recipients cost one STARTTLS/login handshake.
+Failed sends reconnect and are retried with exponential backoff, for the
+recipients that have not received the message yet; an address the server
+permanently refuses (5xx) is not retried.
+"""
+import queue
+import smtplib
+import threading
+import time
+from email.message import Message
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+
+class DeliveryResult(NamedTuple):
+    """Per-recipient outcome of sending one message (or one alert)."""
+    delivered: List[str]
+    # Permanently rejected by the server; retrying will not help
+    refused: List[str]
+    # Not sent; worth retrying later
+    failed: List[str]
+    
+    @classmethod
+    def merge(cls, recipients: List[str], results: List['DeliveryResult']) -> 'DeliveryResult':
+        """Outcome of several messages to `recipients`: delivered only if every message was."""
+        refused = {address for result in results for address in result.refused}
+        failed = {address for result in results for address in result.failed} - refused
+        return cls(
+            [address for address in recipients if address not in refused and address not in failed],
+            [address for address in recipients if address in refused],
+            [address for address in recipients if address in failed]
+        )
+
+
+def parse_recipients(recipients: Union[str, List[str]]) -> List[str]:
+    """Recipient list from a list or a comma-separated string."""
+    if isinstance(recipients, str):
+        recipients = recipients.split(',')
+    return [address.strip() for address in recipients if address and address.strip()]
+
+
+class SMTPSession:
+    """
+    One SMTP connection, opened on first use and reused until it fails or
+    close() is called. Not thread-safe; owned by a single thread.
+    """
+    
+    def __init__(self, smtp_server: str, smtp_port: int, sender_email: str,
+                 sender_password: str, timeout: float = 30):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.timeout = timeout
+        self.server: Optional[smtplib.SMTP] = None
+        self.connects = 0
+    
+    def connect(self) -> smtplib.SMTP:
+        if self.server is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            try:
+                server.starttls()
+                server.login(self.sender_email, self.sender_password)
+            except Exception:
+                server.close()
+                raise
+            self.server = server
+            self.connects += 1
+        return self.server
+    
+    def send(self, message: Message, recipient: str):
+        """Send `message` to one recipient, (re)connecting if needed."""
+        del message['To']
+        message['To'] = recipient
+        try:
+            self.connect().send_message(message, self.sender_email, [recipient])
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, OSError):
+            # The connection is unusable (or in an unknown state); start over next time
+            self.close()
+            raise
+    
+    def close(self):
+        if self.server is not None:
+            server, self.server = self.server, None
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+
+
+def send_each(session: SMTPSession, message: Message,
+              recipients: List[str]) -> Tuple[DeliveryResult, Optional[Exception]]:
+    """
+    Send `message` to each recipient in turn. Stops at the first error that
+    may be temporary and returns it; the recipients not reached by then are
+    reported as failed.
+    """
+    delivered, refused = [], []
+    for index, recipient in enumerate(recipients):
+        try:
+            session.send(message, recipient)
+        except smtplib.SMTPRecipientsRefused as e:
+            code, reason = e.recipients.get(recipient, (0, b''))
+            if code < 500:
+                return DeliveryResult(delivered, refused, recipients[index:]), e
+            print(f"✗ {recipient} was refused by the mail server ({code}); not retrying")
+            refused.append(recipient)
+            continue
+        except Exception as e:
+            return DeliveryResult(delivered, refused, recipients[index:]), e
+        delivered.append(recipient)
+    return DeliveryResult(delivered, refused, []), None
+
+
+class DeliveryWorker:
+    """
+    Queue of outgoing messages drained by a daemon thread.
+    submit() returns immediately; once a message is done with, a callback runs
+    on the worker thread with its DeliveryResult: `on_sent` if no recipient is
+    left to retry, `on_failed` if some were given up on after `max_attempts`.
+    The connection is closed after `idle_seconds` without messages.
+    """
+    
+    def __init__(self, session: SMTPSession, max_attempts: int = 5,
+                 retry_backoff_seconds: float = 5, max_backoff_seconds: float = 300,
+                 idle_seconds: float = 60):
+        self.session = session
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.idle_seconds = idle_seconds
+        self.queue = queue.Queue()
+        self.stopping = threading.Event()
+        self.sent = 0
+        self.failed = 0
+        self.thread = threading.Thread(target=self._run, name='smtp-delivery', daemon=True)
+        self.thread.start()
+    
+    def submit(self, message: Message, recipients: List[str],
+               on_sent: Callable[[DeliveryResult], None] = None,
+               on_failed: Callable[[DeliveryResult], None] = None):
+        self.queue.put((message, list(recipients), on_sent, on_failed))
+    
+    def pending(self) -> int:
+        return self.queue.unfinished_tasks
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued message has been sent or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush the queue (up to `timeout` seconds), then stop the worker."""
+        flushed = self.flush(timeout)
+        self.stopping.set()
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+        return flushed
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        return min(self.retry_backoff_seconds * (2 ** (attempt - 1)), self.max_backoff_seconds)
+    
+    def _run(self):
+        while True:
+            try:
+                item = self.queue.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                self.session.close()
+                continue
+            
+            try:
+                if item is None:
+                    self.session.close()
+                    return
+                self._deliver(*item)
+            finally:
+                self.queue.task_done()
+    
+    def _deliver(self, message: Message, recipients: List[str],
+                 on_sent: Optional[Callable[[DeliveryResult], None]],
+                 on_failed: Optional[Callable[[DeliveryResult], None]]):
+        delivered, refused, remaining = [], [], list(recipients)
+        for attempt in range(1, self.max_attempts + 1):
+            # Recipients already sent to (or refused) are not retried
+            result, error = send_each(self.session, message, remaining)
+            delivered += result.delivered
+            refused += result.refused
+            remaining = result.failed
+            if error is None:
+                break
+            if attempt == self.max_attempts or self.stopping.is_set():
+                self.failed += 1
+                print(f"✗ Failed to send email to {', '.join(remaining)} after {attempt} attempt(s): {str(error)}")
+                break
+            delay = self.backoff_delay(attempt)
+            print(f"⚠️  Email delivery failed ({str(error)}); retrying in {delay:.0f}s")
+            self.stopping.wait(delay)
+        
+        result = DeliveryResult(delivered, refused, remaining)
+        if remaining:
+            self._callback(on_failed, result)
+            return
+        if delivered:
+            self.sent += 1
+            print(f"✓ Email sent successfully: {message['Subject']}")
+        self._callback(on_sent, result)
+    
+    @staticmethod
+    def _callback(callback: Optional[Callable[[DeliveryResult], None]], result: DeliveryResult):
+        if callback is not None:
+            try:
+                callback(result)
+            except Exception as e:
+                print(f"✗ Error in email delivery callback: {str(e)}")
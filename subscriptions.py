@@ -0,0 +1,191 @@
+"""
+Subscriptions and the matching engine that routes jobs to subscribers.
+Each subscriber has their own keywords, locations and companies. Instead of
+testing every job against every subscription, an inverted index maps the
+first word of each keyword and location, and each company, to the
+subscriptions that use it; a job only looks up the words in its title and
+location, and the few candidates found are then checked exactly.
+"""
+import re
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from company_registry import company_key
+from models import Job
+
+WORD = re.compile(r'\w+')
+
+
+class Subscription(NamedTuple):
+    email: str
+    keywords: Tuple[str, ...] = ()   # Title terms; empty matches every title
+    locations: Tuple[str, ...] = ()  # Location terms; empty matches every location
+    companies: Tuple[str, ...] = ()  # Company keys, e.g. 'stripe'; empty matches every company
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Subscription':
+        return cls(
+            email=data['email'].strip(),
+            keywords=tuple(data.get('keywords') or ()),
+            locations=tuple(data.get('locations') or ()),
+            companies=tuple(data.get('companies') or ())
+        )
+    
+    def to_dict(self) -> Dict:
+        return {
+            'email': self.email,
+            'keywords': list(self.keywords),
+            'locations': list(self.locations),
+            'companies': list(self.companies),
+        }
+
+
+def _normalize_terms(terms: Iterable[str]) -> List[str]:
+    return [term.lower().strip() for term in terms if term and term.strip()]
+
+
+def _company_keys(job: Job) -> Set[str]:
+    """Company keys a job can be subscribed under (board slug and company name)."""
+    keys = set()
+    if '-' in (job.source or ''):
+        keys.add(company_key(job.source.split('-', 1)[1]))
+    if job.company:
+        keys.add(company_key(job.company.strip().lower().replace(' ', '-')))
+    return keys
+
+
+class TermIndex:
+    """
+    Inverted index from term first words to (term, subscriber) pairs.
+    A term matches text that contains it starting at a word boundary
+    ('engineer' matches 'Engineering Intern'; case-insensitive).
+    """
+    
+    def __init__(self):
+        self.by_word: Dict[str, List[Tuple[str, int]]] = {}
+        # Longest indexed first word; bounds the prefixes looked up per text word
+        self.max_word = 0
+    
+    def add(self, term: str, subscriber: int):
+        words = WORD.findall(term)
+        if not words:
+            return
+        first = words[0]
+        self.by_word.setdefault(first, []).append((term, subscriber))
+        self.max_word = max(self.max_word, len(first))
+    
+    def matches(self, text: str) -> Set[int]:
+        """Subscribers with at least one term found in `text`."""
+        text = (text or '').lower()
+        found = set()
+        seen_prefixes = set()
+        for word in WORD.findall(text):
+            for length in range(1, min(len(word), self.max_word) + 1):
+                prefix = word[:length]
+                if prefix in seen_prefixes:
+                    continue
+                seen_prefixes.add(prefix)
+                for term, subscriber in self.by_word.get(prefix, ()):
+                    if subscriber not in found and term in text:
+                        found.add(subscriber)
+        return found
+
+
+class SubscriptionIndex:
+    """
+    Routes jobs to the subscriptions they match.
+    A job matches a subscription if it matches one of its keywords, one of its
+    locations (jobs without a location match any) and one of its companies;
+    an empty list matches everything.
+    """
+    
+    def __init__(self, subscriptions: Iterable[Subscription]):
+        # One subscription per email; later entries replace earlier ones
+        by_email = {subscription.email.lower(): subscription for subscription in subscriptions if subscription.email}
+        self.subscriptions: List[Subscription] = list(by_email.values())
+        self.keywords = TermIndex()
+        self.locations = TermIndex()
+        self.companies: Dict[str, Set[int]] = {}
+        # Subscribers without a filter on each dimension
+        self.any_keyword: Set[int] = set()
+        self.any_location: Set[int] = set()
+        self.any_company: Set[int] = set()
+        
+        for number, subscription in enumerate(self.subscriptions):
+            keywords = _normalize_terms(subscription.keywords)
+            locations = _normalize_terms(subscription.locations)
+            companies = {company_key(company) for company in subscription.companies if company and company.strip()}
+            
+            if keywords:
+                for keyword in keywords:
+                    self.keywords.add(keyword, number)
+            else:
+                self.any_keyword.add(number)
+            if locations:
+                for location in locations:
+                    self.locations.add(location, number)
+            else:
+                self.any_location.add(number)
+            if companies:
+                for company in companies:
+                    self.companies.setdefault(company, set()).add(number)
+            else:
+                self.any_company.add(number)
+    
+    def __len__(self) -> int:
+        return len(self.subscriptions)
+    
+    def match(self, job: Job) -> List[Subscription]:
+        """Subscriptions that should receive `job`."""
+        candidates = self.keywords.matches(job.title) | self.any_keyword
+        if not candidates:
+            return []
+        
+        # Narrow by membership tests instead of building the (possibly large)
+        # "no filter" sets into each dimension's result
+        if job.location and len(self.any_location) < len(self.subscriptions):
+            matched = self.locations.matches(job.location)
+            candidates = {number for number in candidates if number in matched or number in self.any_location}
+        if len(self.any_company) < len(self.subscriptions):
+            matched = set()
+            for key in _company_keys(job):
+                matched |= self.companies.get(key, set())
+            candidates = {number for number in candidates if number in matched or number in self.any_company}
+        
+        return [self.subscriptions[number] for number in sorted(candidates)]
+    
+    def route(self, jobs: Iterable[Job]) -> Dict[str, List[Job]]:
+        """Matching jobs per subscriber email (subscribers with no matches are left out)."""
+        routed: Dict[str, List[Job]] = {}
+        for job in jobs:
+            for subscription in self.match(job):
+                routed.setdefault(subscription.email, []).append(job)
+        return routed
+    
+    def search_terms(self) -> Tuple[List[str], List[str]]:
+        """
+        Keywords and locations to scrape with: the union over all subscriptions,
+        or an empty list (no filter) if any subscription leaves it open.
+        """
+        keywords: Dict[str, None] = {}
+        locations: Dict[str, None] = {}
+        for subscription in self.subscriptions:
+            keywords.update(dict.fromkeys(subscription.keywords))
+            locations.update(dict.fromkeys(subscription.locations))
+        return (
+            [] if self.any_keyword else list(keywords),
+            [] if self.any_location else list(locations),
+        )
+    
+    def searches(self, default_keywords: List[str], default_locations: List[str]) -> List[Tuple[str, str]]:
+        """
+        Keyword+location pairs for search boards (Indeed): each subscription's
+        own pairs, deduplicated, so their number grows with the subscribers
+        rather than with the product of everyone's terms. A subscription that
+        leaves keywords or locations open searches the default ones.
+        """
+        pairs: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for subscription in self.subscriptions:
+            for keyword in subscription.keywords or default_keywords:
+                for location in subscription.locations or default_locations:
+                    pairs.setdefault((keyword.strip().lower(), location.strip().lower()), (keyword, location))
+        return list(pairs.values())
@@ -0,0 +1,91 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from rate_limiter import HostRateLimiter
+from scrapers import GreenhouseScraper
+
+BOARD = {
+    'jobs': [
+        {'title': 'Software Engineering Intern', 'location': {'name': 'Remote, US'},
+         'absolute_url': 'https://example.com/jobs/1', 'content': 'Build things'},
+        {'title': 'Data Science Intern', 'location': {'name': 'New York, NY'},
+         'absolute_url': 'https://example.com/jobs/2', 'content': 'Model things'},
+        {'title': 'Staff Engineer', 'location': {'name': 'Remote, US'},
+         'absolute_url': 'https://example.com/jobs/3', 'content': 'Lead things'},
+    ]
+}
+
+
+class BoardHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = json.dumps(BOARD).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalGreenhouseScraper(GreenhouseScraper):
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__('test-agent', **kwargs)
+        self.base_url = base_url
+
+    def board_urls(self, board):
+        return [f"{self.base_url}/v1/boards/{board}/jobs"]
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class SyncScraperAdapterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), BoardHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        from async_scrapers import AsyncHTTPClient, AsyncJobScraper, SyncScraperAdapter
+        base_url = f'http://127.0.0.1:{self.server.server_port}'
+        scraper = LocalGreenhouseScraper(base_url, company_boards=['alpha', 'beta'])
+        limiter = HostRateLimiter({f'127.0.0.1:{self.server.server_port}': {'rate': 1000.0, 'burst': 100}})
+        self.adapter = SyncScraperAdapter(AsyncJobScraper(scraper, AsyncHTTPClient('test-agent', rate_limiter=limiter)))
+
+    def tearDown(self):
+        self.adapter.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_iter_board_jobs_runs_to_completion(self):
+        # Cancelling a finished stream only raised when pump() had not returned
+        # yet, so run it a few times
+        for _ in range(20):
+            results = list(self.adapter.iter_board_jobs(['engineer', 'data'], ['remote', 'new york']))
+        jobs = [job for result in results for job in result.jobs]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(sorted((job.source, job.title) for job in jobs), [
+            ('greenhouse-alpha', 'Data Science Intern'), ('greenhouse-alpha', 'Software Engineering Intern'),
+            ('greenhouse-beta', 'Data Science Intern'), ('greenhouse-beta', 'Software Engineering Intern'),
+        ])
+
+    def test_scrape_jobs_returns_every_board(self):
+        jobs = self.adapter.scrape_jobs(['engineer'], ['remote'])
+        self.assertEqual([(job.source, job.title) for job in jobs], [
+            ('greenhouse-alpha', 'Software Engineering Intern'), ('greenhouse-beta', 'Software Engineering Intern'),
+        ])
+
+    def test_early_exit_cancels_the_rest(self):
+        for result in self.adapter.iter_board_jobs(['engineer'], ['remote']):
+            break
+
+
+if __name__ == '__main__':
+    unittest.main()
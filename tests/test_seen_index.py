@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from database import JobDatabase
+from models import Job
+
+
+def make_job(job_id: str) -> Job:
+    return Job.coerce({
+        'job_id': job_id,
+        'title': f'Engineer {job_id}',
+        'company': 'Acme',
+        'location': 'Remote',
+        'url': f'https://example.com/jobs/{job_id}',
+        'source': 'Test',
+    })
+
+
+class SeenIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = JobDatabase(os.path.join(self.tmp.name, 'jobs.db'))
+
+    def tearDown(self):
+        self.db.conn.close()
+        self.tmp.cleanup()
+
+    def test_stats_report_sizing_before_the_index_is_built(self):
+        self.db.add_jobs([make_job(f'old-{i}') for i in range(10)])
+        self.db.seen = None
+        seen = self.db.get_stats()['seen_index']
+        self.assertFalse(seen['loaded'])
+        self.assertEqual(seen['entries'], 10)
+        self.assertGreater(seen['memory_bytes'], 0)
+        self.assertIsNone(self.db.seen)
+
+    def test_add_jobs_consults_the_index(self):
+        self.db.add_jobs([make_job(f'old-{i}') for i in range(50)])
+        self.db.seen = None
+
+        new = self.db.add_jobs([make_job(f'old-{i}') for i in range(50)] +
+                               [make_job(f'new-{i}') for i in range(50)])
+
+        self.assertEqual(sorted(job.job_id for job in new), sorted(f'new-{i}' for i in range(50)))
+        seen = self.db.get_stats()['seen_index']
+        self.assertTrue(seen['loaded'])
+        self.assertEqual(seen['lookups'], 100)
+        # Definitely-new ids never reached the IN (...) lookup
+        self.assertGreaterEqual(seen['db_lookups_skipped'], 45)
+        self.assertEqual(seen['entries'], 100)
+
+    def test_known_batch_skips_the_write_transaction(self):
+        self.db.add_jobs([make_job(f'old-{i}') for i in range(5)])
+        transactions = []
+        original = self.db.transaction
+        self.db.transaction = lambda: transactions.append(1) or original()
+
+        self.assertEqual(self.db.add_jobs([make_job(f'old-{i}') for i in range(5)]), [])
+        self.assertEqual(transactions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()